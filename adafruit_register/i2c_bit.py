@@ -60,14 +60,22 @@ class RWBit:
         return bool(self.buffer[self.byte] & self.bit_mask)
 
     def __set__(self, obj: I2CDeviceDriver, value: bool) -> None:
+        staged = getattr(obj, "_staged_writes", None)
+        if staged is not None:
+            staged.stage(self, value)
+            return
         with obj.i2c_device as i2c:
             i2c.write_then_readinto(self.buffer, self.buffer, out_end=1, in_start=1)
-            if value:
-                self.buffer[self.byte] |= self.bit_mask
-            else:
-                self.buffer[self.byte] &= ~self.bit_mask
+            self._apply(self.buffer, value)
             i2c.write(self.buffer)
 
+    def _apply(self, buffer: bytearray, value: bool) -> None:
+        """Set the bit in a buffer holding the register address and contents."""
+        if value:
+            buffer[self.byte] |= self.bit_mask
+        else:
+            buffer[self.byte] &= ~self.bit_mask
+
 
 class ROBit(RWBit):
     """Single bit register that is read only. Subclass of `RWBit`.
@@ -78,24 +78,32 @@ class RWBits:
         return reg
 
     def __set__(self, obj: I2CDeviceDriver, value: int) -> None:
-        value <<= self.lowest_bit  # shift the value over to the right spot
+        staged = getattr(obj, "_staged_writes", None)
+        if staged is not None:
+            staged.stage(self, value)
+            return
         with obj.i2c_device as i2c:
             i2c.write_then_readinto(self.buffer, self.buffer, out_end=1, in_start=1)
-            reg = 0
-            order = range(len(self.buffer) - 1, 0, -1)
-            if not self.lsb_first:
-                order = range(1, len(self.buffer))
-            for i in order:
-                reg = (reg << 8) | self.buffer[i]
-            # print("old reg: ", hex(reg))
-            reg &= ~self.bit_mask  # mask off the bits we're about to change
-            reg |= value  # then or in our new value
-            # print("new reg: ", hex(reg))
-            for i in reversed(order):
-                self.buffer[i] = reg & 0xFF
-                reg >>= 8
+            self._apply(self.buffer, value)
             i2c.write(self.buffer)
 
+    def _apply(self, buffer: bytearray, value: int) -> None:
+        """Set the bits in a buffer holding the register address and contents."""
+        value <<= self.lowest_bit  # shift the value over to the right spot
+        reg = 0
+        order = range(len(self.buffer) - 1, 0, -1)
+        if not self.lsb_first:
+            order = range(1, len(self.buffer))
+        for i in order:
+            reg = (reg << 8) | buffer[i]
+        # print("old reg: ", hex(reg))
+        reg &= ~self.bit_mask  # mask off the bits we're about to change
+        reg |= value  # then or in our new value
+        # print("new reg: ", hex(reg))
+        for i in reversed(order):
+            buffer[i] = reg & 0xFF
+            reg >>= 8
+
 
 class ROBits(RWBits):
     """
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# pylint: disable=too-few-public-methods
+
+"""
+`adafruit_register.i2c_cached`
+====================================================
+
+Write-through cached variants of the bit and struct registers.
+
+The last value read or written is remembered on the device object, so repeated
+reads are served from memory instead of the bus. Only use these for registers the
+device never changes by itself, such as configuration registers, and call
+`invalidate_cache` after anything that changes them behind the driver's back,
+like a device reset.
+"""
+
+from .i2c_bit import RWBit
+from .i2c_bits import RWBits
+from .i2c_struct import UnaryStruct
+
+try:
+    from typing import Optional, Type, Any
+    from circuitpython_typing.device_drivers import I2CDeviceDriver
+except ImportError:
+    pass
+
+
+def _get_cache(obj: I2CDeviceDriver) -> dict:
+    """Return the register cache of ``obj``, creating it on first use.
+
+    :param obj: the device object the registers belong to (required, no default)
+    """
+    # pylint: disable=protected-access
+    try:
+        return obj._register_cache
+    except AttributeError:
+        obj._register_cache = {}
+        return obj._register_cache
+
+
+def invalidate_cache(obj: I2CDeviceDriver) -> None:
+    """Forget every cached register value of ``obj`` so the next read of each cached
+    register goes to the device.
+
+    :param obj: the device object the registers belong to (required, no default)
+    """
+    _get_cache(obj).clear()
+
+
+class CachedRWBit(RWBit):
+    """
+    Single bit register that is readable and writeable, served from the cache of the
+    device object once read or written. Subclass of `RWBit`.
+
+    Values are `bool`
+
+    :param int register_address: The register address to read the bit from
+    :param int bit: The bit index within the byte at ``register_address``
+    :param int register_width: The number of bytes in the register. Defaults to 1.
+    :param bool lsb_first: Is the first byte we read from I2C the LSB? Defaults to true
+    """
+
+    def __get__(
+        self,
+        obj: Optional[I2CDeviceDriver],
+        objtype: Optional[Type[I2CDeviceDriver]] = None,
+    ) -> bool:
+        cache = _get_cache(obj)
+        value = cache.get(self)
+        if value is None:
+            value = super().__get__(obj, objtype)
+            cache[self] = value
+        return value
+
+    def __set__(self, obj: I2CDeviceDriver, value: bool) -> None:
+        super().__set__(obj, value)
+        _get_cache(obj)[self] = bool(value)
+
+
+class CachedRWBits(RWBits):
+    """
+    Multibit register (less than a full byte) that is readable and writeable, served
+    from the cache of the device object once read or written. Subclass of `RWBits`.
+
+    Values are `int` between 0 and 2 ** ``num_bits`` - 1.
+
+    :param int num_bits: The number of bits in the field.
+    :param int register_address: The register address to read the bit from
+    :param int lowest_bit: The lowest bits index within the byte at ``register_address``
+    :param int register_width: The number of bytes in the register. Defaults to 1.
+    :param bool lsb_first: Is the first byte we read from I2C the LSB? Defaults to true
+    :param bool signed: If True, the value is a "two's complement" signed value.
+                        If False, it is unsigned.
+    """
+
+    def __get__(
+        self,
+        obj: Optional[I2CDeviceDriver],
+        objtype: Optional[Type[I2CDeviceDriver]] = None,
+    ) -> int:
+        cache = _get_cache(obj)
+        value = cache.get(self)
+        if value is None:
+            value = super().__get__(obj, objtype)
+            cache[self] = value
+        return value
+
+    def __set__(self, obj: I2CDeviceDriver, value: int) -> None:
+        super().__set__(obj, value)
+        _get_cache(obj)[self] = value
+
+
+class CachedUnaryStruct(UnaryStruct):
+    """
+    Arbitrary single value structure register that is readable and writeable, served
+    from the cache of the device object once read or written. Subclass of
+    `UnaryStruct`.
+
+    Values map to the first value in the defined struct.  See struct
+    module documentation for struct format string and its possible value types.
+
+    :param int register_address: The register address to read the bit from
+    :param str struct_format: The struct format string for this register.
+    """
+
+    def __get__(
+        self,
+        obj: Optional[I2CDeviceDriver],
+        objtype: Optional[Type[I2CDeviceDriver]] = None,
+    ) -> Any:
+        cache = _get_cache(obj)
+        value = cache.get(self)
+        if value is None:
+            value = super().__get__(obj, objtype)
+            cache[self] = value
+        return value
+
+    def __set__(self, obj: I2CDeviceDriver, value: Any) -> None:
+        super().__set__(obj, value)
+        _get_cache(obj)[self] = value
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MIT
+# pylint: disable=too-few-public-methods
+
+"""
+`adafruit_register.i2c_staged`
+====================================================
+
+Merged read-modify-write of bit registers
+"""
+
+try:
+    from typing import Optional, Type, Union
+    from types import TracebackType
+    from circuitpython_typing.device_drivers import I2CDeviceDriver
+    from .i2c_bit import RWBit
+    from .i2c_bits import RWBits
+except ImportError:
+    pass
+
+
+class StagedWrites:
+    """
+    Context manager that merges `RWBit` and `RWBits` writes to the same register.
+
+    While active, writes to the bit registers of ``obj`` are only recorded. On exit
+    every register that was written is read once, updated with all of its writes in
+    the order they were made, and written back once. Registers are committed in the
+    order they were first written. Reads and writes of any other register type still
+    go straight to the device, and reads return the device value rather than a
+    staged one. Nested contexts on the same device join the outermost one.
+
+    .. code-block:: python
+
+        with StagedWrites(sensor):
+            sensor._clock_source = 1
+            sensor.sleep = False
+
+    :param obj: The device object whose bit registers are staged
+    """
+
+    def __init__(self, obj: I2CDeviceDriver) -> None:
+        self.obj = obj
+        self.writes = []
+        self.outer = None
+
+    def __enter__(self) -> "StagedWrites":
+        self.outer = getattr(self.obj, "_staged_writes", None)
+        if self.outer is None:
+            self.obj._staged_writes = self  # pylint: disable=protected-access
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        if self.outer is None:
+            self.obj._staged_writes = None  # pylint: disable=protected-access
+            if exc_type is None:
+                self.commit()
+        return False
+
+    def stage(self, register: Union[RWBit, RWBits], value: Union[bool, int]) -> None:
+        """Record a write to be made on `commit`.
+
+        :param register: The bit register descriptor being written
+        :param value: The value written to it
+        """
+        self.writes.append((register, value))
+
+    def commit(self) -> None:
+        """Write every staged register with a single read and a single write each."""
+        registers = {}
+        order = []
+        for register, value in self.writes:
+            address = register.buffer[0]
+            if address not in registers:
+                registers[address] = []
+                order.append(address)
+            registers[address].append((register, value))
+        self.writes = []
+
+        with self.obj.i2c_device as i2c:
+            for address in order:
+                writes = registers[address]
+                buf = bytearray(max(len(register.buffer) for register, _ in writes))
+                buf[0] = address
+                i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+                for register, value in writes:
+                    register._apply(buf, value)  # pylint: disable=protected-access
+                i2c.write(buf)
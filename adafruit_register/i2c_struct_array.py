@@ -18,7 +18,7 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Register.git"
 import struct
 
 try:
-    from typing import Tuple, Optional, Type
+    from typing import Tuple, Optional, Type, List, Sequence
     from circuitpython_typing.device_drivers import I2CDeviceDriver
 except ImportError:
     pass
@@ -32,29 +32,49 @@ class _BoundStructArray:
     :param int register_address: The register address to read the bit from
     :param str struct_format: The struct format string for each register element
     :param int count: Number of elements in the array
+    :param bool keep_buffer: Keep the buffer for bulk transfers allocated between calls
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         obj: I2CDeviceDriver,
         register_address: int,
         struct_format: str,
         count: int,
+        keep_buffer: bool = False,
     ) -> None:
         self.format = struct_format
         self.first_register = register_address
         self.obj = obj
         self.count = count
+        self.size = struct.calcsize(struct_format)
+        self.keep_buffer = keep_buffer
+        self.buffer = None
 
     def _get_buffer(self, index: int) -> bytearray:
         """Shared bounds checking and buffer creation."""
         if not 0 <= index < self.count:
             raise IndexError()
-        size = struct.calcsize(self.format)
         # We create the buffer every time instead of keeping the buffer (which is 32 bytes at least)
         # around forever.
-        buf = bytearray(size + 1)
-        buf[0] = self.first_register + size * index
+        buf = bytearray(self.size + 1)
+        buf[0] = self.first_register + self.size * index
+        return buf
+
+    def _get_bulk_buffer(self) -> bytearray:
+        """Buffer covering every element, reused when ``keep_buffer`` is set."""
+        buf = self.buffer
+        if buf is None:
+            buf = bytearray(self.size * self.count + 1)
+            buf[0] = self.first_register
+            if self.keep_buffer:
+                self.buffer = buf
+        return buf
+
+    def _read_bulk(self) -> bytearray:
+        buf = self._get_bulk_buffer()
+        with self.obj.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
         return buf
 
     def __getitem__(self, index: int) -> Tuple:
@@ -72,6 +92,43 @@ class _BoundStructArray:
     def __len__(self) -> int:
         return self.count
 
+    def read_all(self) -> List[Tuple]:
+        """Read every element in a single transaction.
+
+        :return: A list with one struct tuple per element
+        """
+        buf = self._read_bulk()
+        return [
+            struct.unpack_from(self.format, buf, 1 + self.size * index)
+            for index in range(self.count)
+        ]
+
+    def read_into(self, values: Sequence) -> None:
+        """Read every element in a single transaction and store the struct values of
+        all elements one after another in ``values``, such as an `array.array`.
+
+        :param values: Mutable sequence with room for every value of every element
+        """
+        buf = self._read_bulk()
+        i = 0
+        for index in range(self.count):
+            for value in struct.unpack_from(self.format, buf, 1 + self.size * index):
+                values[i] = value
+                i += 1
+
+    def write_all(self, values: Sequence[Tuple]) -> None:
+        """Write every element in a single transaction.
+
+        :param values: One struct tuple per element
+        """
+        if len(values) != self.count:
+            raise ValueError("Expected {} elements".format(self.count))
+        buf = self._get_bulk_buffer()
+        for index, value in enumerate(values):
+            struct.pack_into(self.format, buf, 1 + self.size * index, *value)
+        with self.obj.i2c_device as i2c:
+            i2c.write(buf)
+
 
 class StructArray:
     """
@@ -88,12 +145,22 @@ class StructArray:
     :param int register_address: The register address to begin reading the array from
     :param str struct_format: The struct format string for this register.
     :param int count: Number of elements in the array
+    :param bool keep_buffer: Keep the buffer used by the bulk `_BoundStructArray.read_all`,
+      `_BoundStructArray.read_into` and `_BoundStructArray.write_all` allocated between
+      calls. Defaults to False.
     """
 
-    def __init__(self, register_address: int, struct_format: str, count: int) -> None:
+    def __init__(
+        self,
+        register_address: int,
+        struct_format: str,
+        count: int,
+        keep_buffer: bool = False,
+    ) -> None:
         self.format = struct_format
         self.address = register_address
         self.count = count
+        self.keep_buffer = keep_buffer
         self.array_id = "_structarray{}".format(register_address)
 
     def __get__(
@@ -109,6 +176,8 @@ class StructArray:
             setattr(
                 obj,
                 self.array_id,
-                _BoundStructArray(obj, self.address, self.format, self.count),
+                _BoundStructArray(
+                    obj, self.address, self.format, self.count, self.keep_buffer
+                ),
             )
         return getattr(obj, self.array_id)
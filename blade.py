@@ -0,0 +1,320 @@
+"""
+Time based animations for the blade LED strips.
+
+Effects draw each frame from the time since they started rather than from how often
+they are drawn, so an animation takes the same time however busy the board is.
+Frames are composed in one ``bytearray`` already in the GRB order the strips expect,
+and `Blade.update` pushes it to every data pin with ``neopixel_write``, at most once
+per call and only when a pixel changed. While no effect plays, a background such as
+`Shimmer` keeps drawing from precomputed tables.
+"""
+
+from neopixel_write import neopixel_write
+from scheduler import ticks_diff
+
+_BLACK = (0, 0, 0)
+_MAX_PAINTS = 8
+
+
+class Blade:
+    """
+    The LED strips of the blade, all the same length and showing the same effect.
+
+    Each strip shows a segment of the frame, given as the pixel the segment starts at
+    and whether the strip runs from the tip to the hilt. Strips with the same segment
+    share its bytes, so drawing on them costs the same as drawing on one strip.
+
+    :param pins: The ``digitalio.DigitalInOut`` data pins, set to outputs
+    :param int pixel_count: The number of pixels on each strip
+    :param segments: The ``(offset, reverse)`` segment of each strip. Defaults to
+        every strip showing the same segment from the hilt to the tip
+    """
+
+    def __init__(self, pins, pixel_count, segments=None):
+        if segments is None:
+            segments = ((0, False),) * len(pins)
+        self.pins = pins
+        self.pixel_count = pixel_count
+        self.segments = tuple(segments)
+        self.frame = bytearray(
+            (max(offset for offset, _ in self.segments) + pixel_count) * 3
+        )
+        self.effect = None
+        self.started = 0
+        self.background = None
+        self.changed = False
+        self.frames = 0
+
+        self._unique_segments = []
+        for segment in self.segments:
+            if segment not in self._unique_segments:
+                self._unique_segments.append(segment)
+        frame = memoryview(self.frame)
+        self._views = [
+            frame[offset * 3 : (offset + pixel_count) * 3]
+            for offset, _ in self.segments
+        ]
+        self._paints = {}
+
+    @property
+    def busy(self):
+        """`True` while an effect is playing"""
+        return self.effect is not None
+
+    def run(self, color):
+        """Return a new strip length run of ``color`` in wire order, for `fill_run`.
+
+        :param color: The RGB color
+        """
+        buffer = bytearray(self.pixel_count * 3)
+        buffer[0:3] = bytes((color[1], color[0], color[2]))
+        filled = 3
+        while filled < len(buffer):
+            count = min(filled, len(buffer) - filled)
+            buffer[filled : filled + count] = buffer[0:count]
+            filled += count
+        return memoryview(buffer)
+
+    def paint(self, color):
+        """Return a strip length run of ``color`` in wire order from a small cache,
+        built on first use.
+
+        :param color: The RGB color
+        """
+        key = (color[0] << 16) | (color[1] << 8) | color[2]
+        paint = self._paints.get(key)
+        if paint is None:
+            if len(self._paints) >= _MAX_PAINTS:
+                self._paints.clear()
+            paint = self.run(color)
+            self._paints[key] = paint
+        return paint
+
+    def fill(self, color, start=0, end=None, strip=None):
+        """Set pixels ``start`` up to ``end`` to ``color``. The change is shown on the
+        next `update`.
+
+        :param color: The RGB color
+        :param int start: The first pixel, counted from the hilt
+        :param int end: One past the last pixel. Defaults to the tip
+        :param int strip: The index of the only strip to set. Defaults to all strips
+        """
+        self.fill_run(self.paint(color), start, end, strip)
+
+    def fill_run(self, run, start=0, end=None, strip=None):
+        """Like `fill`, with the color given as a run from `run`.
+
+        :param memoryview run: The strip length run of the color
+        :param int start: The first pixel, counted from the hilt
+        :param int end: One past the last pixel. Defaults to the tip
+        :param int strip: The index of the only strip to set. Defaults to all strips
+        """
+        if end is None:
+            end = self.pixel_count
+        if end <= start:
+            return
+        paint = run[: (end - start) * 3]
+        if strip is None:
+            segments = self._unique_segments
+        else:
+            segments = (self.segments[strip],)
+        for offset, reverse in segments:
+            first = offset + (self.pixel_count - end if reverse else start)
+            self.frame[first * 3 : (first + end - start) * 3] = paint
+        self.changed = True
+
+    def play(self, effect, now):
+        """Start ``effect``, replacing any effect that is still playing.
+
+        :param Effect effect: The effect to play
+        :param int now: The current ``supervisor.ticks_ms()``
+        """
+        self.effect = effect
+        self.started = now
+
+    def update(self, now):
+        """Draw the frame of the current effect at ``now`` and push the frame to the
+        strips if anything changed since they were last pushed. Call at the frame
+        rate.
+
+        :param int now: The current ``supervisor.ticks_ms()``
+        """
+        effect = self.effect
+        if effect is not None:
+            elapsed_ms = min(ticks_diff(now, self.started), effect.duration_ms)
+            effect.render(self, elapsed_ms)
+            if elapsed_ms >= effect.duration_ms:
+                self.effect = None
+                if self.background is not None:
+                    self.background.reset()
+        elif self.background is not None:
+            self.background.render(self, now)
+
+        if self.changed:
+            self.changed = False
+            self.frames += 1
+            for i in range(len(self.pins)):
+                neopixel_write(self.pins[i], self._views[i])
+
+
+class Effect:
+    """
+    An animation of the blade. Subclasses draw frames in `render`.
+
+    :param int duration_ms: How long the effect plays in milliseconds
+    """
+
+    def __init__(self, duration_ms):
+        self.duration_ms = max(duration_ms, 1)
+
+    def render(self, blade, elapsed_ms):
+        """Draw the frame ``elapsed_ms`` into the effect, leaving pixels that stay the
+        same alone. ``elapsed_ms`` equal to ``duration_ms`` is the final frame.
+
+        :param Blade blade: The blade to draw on
+        :param int elapsed_ms: The time since the effect started
+        """
+        raise NotImplementedError()
+
+
+class Ignition(Effect):
+    """
+    Lights the blade from the hilt to the tip, with a window of ``tip_color`` running
+    ahead of ``color``. Ends with the whole blade in ``color``.
+
+    :param color: The RGB blade color
+    :param tip_color: The RGB color of the moving window
+    :param int window: The length of the moving window in pixels
+    :param int duration_ms: How long the ignition takes in milliseconds
+    """
+
+    def __init__(self, color, tip_color, window, duration_ms):
+        super().__init__(duration_ms)
+        self.color = color
+        self.tip_color = tip_color
+        self.window = window
+        self.front = 0
+
+    def render(self, blade, elapsed_ms):
+        travel = blade.pixel_count + self.window
+        front = travel * elapsed_ms // self.duration_ms
+        if front == self.front:
+            return
+        blade.fill(self.tip_color, self.front, min(front, blade.pixel_count))
+        blade.fill(
+            self.color,
+            max(self.front - self.window, 0),
+            min(max(front - self.window, 0), blade.pixel_count),
+        )
+        self.front = front
+
+
+class Retraction(Effect):
+    """
+    Darkens the blade from the tip to the hilt. Starts from the whole blade in
+    ``color`` so any flash still showing is cleared.
+
+    :param color: The RGB blade color
+    :param int duration_ms: How long the retraction takes in milliseconds
+    """
+
+    def __init__(self, color, duration_ms):
+        super().__init__(duration_ms)
+        self.color = color
+        self.lit = None
+
+    def render(self, blade, elapsed_ms):
+        lit = blade.pixel_count - blade.pixel_count * elapsed_ms // self.duration_ms
+        if self.lit is None:
+            blade.fill(self.color, 0, lit)
+            self.lit = blade.pixel_count
+        if lit == self.lit:
+            return
+        blade.fill(_BLACK, lit, self.lit)
+        self.lit = lit
+
+
+class Flash(Effect):
+    """
+    Lights a window of ``flash_color`` that reaches up the first strip and down the
+    second from ``point``, then returns the blade to ``color``.
+
+    :param color: The RGB blade color
+    :param flash_color: The RGB color of the flash
+    :param int point: The pixel the flash starts at
+    :param int size: The length of the flash on each strip in pixels
+    :param int duration_ms: How long the flash shows in milliseconds
+    """
+
+    def __init__(self, color, flash_color, point, size, duration_ms):
+        super().__init__(duration_ms)
+        self.color = color
+        self.flash_color = flash_color
+        self.point = point
+        self.size = size
+        self.shown = False
+
+    def render(self, blade, elapsed_ms):
+        if elapsed_ms >= self.duration_ms:
+            blade.fill(self.color)
+        elif not self.shown:
+            end = min(self.point + self.size, blade.pixel_count - 1)
+            blade.fill(self.flash_color, self.point, end, strip=0)
+            blade.fill(self.flash_color, max(self.point - self.size, 0), self.point, 1)
+            self.shown = True
+
+
+class Shimmer:
+    """
+    Background that sets the whole blade to a palette color picked by a table of
+    levels, one per frame of a loop, such as the loudness of the hum.
+
+    :param bytes table: The level of each frame from 0 to 255
+    :param palette: The RGB colors the levels map onto, from the lowest level up
+    :param int loop_ms: The length of the loop in milliseconds
+    :param int started: The ``supervisor.ticks_ms()`` the loop started at
+    """
+
+    def __init__(self, table, palette, loop_ms, started):
+        count = len(palette)
+        self.levels = bytes(value * count >> 8 for value in table)
+        self.palette = palette
+        self.loop_ms = max(loop_ms, 1)
+        self.started = started
+        self.runs = None
+        self.level = None
+
+    def reset(self):
+        """Draw the current level on the next `render`, even if it did not change"""
+        self.level = None
+
+    def render(self, blade, now):
+        """Draw the level of the frame at ``now`` if it changed.
+
+        :param Blade blade: The blade to draw on
+        :param int now: The current ``supervisor.ticks_ms()``
+        """
+        if self.runs is None:
+            self.runs = [blade.run(color) for color in self.palette]
+        position = ticks_diff(now, self.started) % self.loop_ms
+        level = self.levels[position * len(self.levels) // self.loop_ms]
+        if level != self.level:
+            blade.fill_run(self.runs[level])
+            self.level = level
+
+
+def shimmer_palette(color, peak_color, depth, count=8):
+    """Return ``count`` colors for `Shimmer`: ``color`` dimmed by ``depth`` up to full
+    ``color``, then ``peak_color`` for the loudest level.
+
+    :param color: The RGB blade color
+    :param peak_color: The RGB color of the loudest level
+    :param float depth: How much of ``color`` the quietest level loses, from 0 to 1
+    :param int count: The number of colors
+    """
+    palette = []
+    for level in range(count - 1):
+        scale = 1 - depth + depth * level / max(count - 2, 1)
+        palette.append(tuple(round(channel * scale) for channel in color))
+    palette.append(tuple(peak_color))
+    return palette
@@ -1,30 +1,90 @@
 import time
+import asyncio
 import board
-import audiocore
 import audiomixer
 import audiobusio
 import digitalio
 import math
 import busio
 import json
-from os import listdir
-
-from mpu6500 import MPU6500
+import supervisor
+from array import array
+from os import listdir, stat
+
+from mpu6500 import MPU6500, Bandwidth, GyroRange, Range, FIFO_FRAME_SIZE
+from motion import ClashDetector, MAGNITUDE_SHIFT, unpack_frame
+from scheduler import Periodic, ticks_add, ticks_diff
+from blade import Blade, Ignition, Retraction, Flash, Shimmer, shimmer_palette
+from profiles import ProfileCache, SoundPool, load_manifest
+from sdcard_storage import mount_sd, read_rate
+from log import Logger, DEBUG, INFO
 from random import randint
 
-import neopixel
+# messages at LOG_LEVEL and above are buffered and written to the serial console
+# every LOG_FLUSH_MS while one is connected, each at most once a second. DEBUG adds
+# the motion and audio values of every sample
+LOG_LEVEL = INFO
+LOG_FLUSH_MS = 250
+LOG = Logger(LOG_LEVEL)
 
 # Initialize I2C bus on GPIO0 (SDA) and GPIO1 (SCL)
 i2c_bus = busio.I2C(scl=board.GP1, sda=board.GP0)
 
 # Initialize the MPU6500
 mpu = MPU6500(i2c_bus, address=0x68)
+print(f"MPU6500 ready in {mpu.startup_time * 1000:.0f} ms")
+
+# INT on GP14 goes high when the parked IMU detects motion
+int_pin = digitalio.DigitalInOut(board.GP14)
+int_pin.direction = digitalio.Direction.INPUT
 
 # Initialize pull up pin on GP15
 pin = digitalio.DigitalInOut(board.GP15)
 pin.direction = digitalio.Direction.INPUT
 pin.pull = digitalio.Pull.UP
 
+CALIBRATION_PATH = "/calibration.json"
+
+
+def calibrate_sensor():
+    # measure the IMU bias at rest and store it so it can be restored on boot
+    print("Calibrating, keep the saber still")
+    accel_offset, gyro_offset = mpu.calibrate()
+    calibration = {"gyro_offset": gyro_offset}
+    if accel_offset is None:
+        print("The saber is not lying flat, only the gyroscope was calibrated")
+    else:
+        calibration["accel_offset"] = accel_offset
+    print(f"Saving calibration {calibration}")
+    try:
+        with open(CALIBRATION_PATH, "w") as file:
+            json.dump(calibration, file)
+    except OSError:
+        print("Could not save calibration, is the filesystem writable?")
+
+
+def load_calibration():
+    try:
+        with open(CALIBRATION_PATH, "r") as file:
+            calibration = json.load(file)
+    except (OSError, ValueError):
+        return False
+
+    if "accel_offset" in calibration:
+        mpu.accel_offset = calibration["accel_offset"]
+    mpu.gyro_offset = calibration["gyro_offset"]
+    return True
+
+
+# hold the button while powering on to recalibrate, then let go and keep still
+if not pin.value:
+    while not pin.value:
+        time.sleep(0.05)
+    time.sleep(1)
+    calibrate_sensor()
+elif not load_calibration():
+    calibrate_sensor()
+
 i2s_bclk = board.GP6  # BCK (Bit Clock) connected to GPIO6
 i2s_wsel = board.GP7  # LRC (Word Select/Left-Right Clock) connected to GPIO7
 i2s_data = board.GP8  # DIN (Data Input) connected to GPIO8
@@ -33,12 +93,6 @@ num_voices = 4
 
 audio = audiobusio.I2SOut(bit_clock=i2s_bclk, word_select=i2s_wsel, data=i2s_data)
 
-volume_0_wav = audiocore.WaveFile(open("/other_sounds/volume_0.wav", "rb"))
-volume_25_wav = audiocore.WaveFile(open("/other_sounds/volume_25.wav", "rb"))
-volume_50_wav = audiocore.WaveFile(open("/other_sounds/volume_50.wav", "rb"))
-volume_75_wav = audiocore.WaveFile(open("/other_sounds/volume_75.wav", "rb"))
-volume_100_wav = audiocore.WaveFile(open("/other_sounds/volume_100.wav", "rb"))
-
 mixer = audiomixer.Mixer(
     voice_count=num_voices,
     sample_rate=16000,
@@ -54,15 +108,282 @@ mixer.voice[1].level = 0.0
 mixer.voice[2].level = 0.0
 mixer.voice[3].level = 1
 
+# the sound last started on each voice, so open files that are still playing are
+# not closed to make room for another
+VOICE_SOUNDS = [None] * num_voices
+
+
+def play(voice, sound, loop=False):
+    VOICE_SOUNDS[voice] = sound
+    mixer.voice[voice].play(sound, loop=loop)
+
+
+def is_playing(sound):
+    for voice in range(num_voices):
+        if VOICE_SOUNDS[voice] is sound and mixer.voice[voice].playing:
+            return True
+    return False
+
+
+# keep at most this many sound files open, closing the least recently used one
+# that is not playing to open another
+MAX_OPEN_SOUNDS = 8
+# each open sound reads this many bytes ahead of the mixer, from 8 to 1024, as two
+# halves refilled in turn. Larger buffers ride out slower reads from an SD card
+WAVE_BUFFER_SIZE = 1024
+SOUNDS = SoundPool(MAX_OPEN_SOUNDS, is_playing, WAVE_BUFFER_SIZE)
+
+
+# profile config values for the MPU6500 filter bandwidth (Hz), gyroscope range
+# (degrees per second) and accelerometer range (g). 260 Hz turns the filter off,
+# which makes the MPU6500 sample at 8 kHz and ignore the sample rate, so it is not
+# offered
+FILTER_BANDWIDTHS = {
+    184: Bandwidth.BAND_184_HZ,
+    94: Bandwidth.BAND_94_HZ,
+    44: Bandwidth.BAND_44_HZ,
+    21: Bandwidth.BAND_21_HZ,
+    10: Bandwidth.BAND_10_HZ,
+    5: Bandwidth.BAND_5_HZ,
+}
+GYRO_RANGES = {
+    250: GyroRange.RANGE_250_DPS,
+    500: GyroRange.RANGE_500_DPS,
+    1000: GyroRange.RANGE_1000_DPS,
+    2000: GyroRange.RANGE_2000_DPS,
+}
+ACCEL_RANGES = {
+    2: Range.RANGE_2_G,
+    4: Range.RANGE_4_G,
+    8: Range.RANGE_8_G,
+    16: Range.RANGE_16_G,
+}
+
+
+# the longest period in milliseconds of reading the IMU while the blade is
+# retracted, shortened at high sample rates so the FIFO is read at most 30 samples
+# apart and a late read still fits in its 42 frames
+MAX_RETRACTED_SENSE_PERIOD_MS = 50
+
+
+def configure_sensor(config):
+    global SENSE_PERIOD_MS
+    global RETRACTED_SENSE_PERIOD_MS
+
+    # the MPU6500 samples at 1 kHz / (1 + divisor) with its filter enabled, and the
+    # blade reads it once per sample while it is on
+    bandwidth = config.get("filter_bandwidth", 184)
+    if bandwidth not in FILTER_BANDWIDTHS:
+        raise ValueError(
+            f"filter_bandwidth {bandwidth} is not one of {sorted(FILTER_BANDWIDTHS)}"
+        )
+    sample_rate = config.get("sample_rate", 100)
+    divisor = min(max(round(1000 / sample_rate) - 1, 0), 255)
+    SENSE_PERIOD_MS = 1 + divisor
+    RETRACTED_SENSE_PERIOD_MS = min(MAX_RETRACTED_SENSE_PERIOD_MS, 30 * SENSE_PERIOD_MS)
+
+    mpu.configure(
+        sample_rate_divisor=divisor,
+        filter_bandwidth=FILTER_BANDWIDTHS[bandwidth],
+        gyro_range=GYRO_RANGES[config.get("gyro_range", 500)],
+        accelerometer_range=ACCEL_RANGES[config.get("accel_range", 2)],
+    )
+
+
+# samples after a clash or a volume shake during which no other is detected
+CLASH_REFRACTORY_MS = 250
+SHAKE_REFRACTORY_MS = 500
+
+
+def load_thresholds(config):
+    # convert the profile thresholds to raw sensor counts once, so the main loop
+    # compares small integers and never allocates
+    global TWIST_THRESHOLD
+    global TWIST_TOLERANCE
+    global TWIST_RELEASE
+    global IDLE_GYRO_THRESHOLD
+    global SWING_STEP_SIZE
+    global ROTATION_STEPS
+    global CLASH_DETECTOR
+    global SHAKE_DETECTOR
+
+    gyro_scale = mpu.raw_gyro_scale
+    accel_scale = mpu.raw_acceleration_scale
+
+    TWIST_THRESHOLD = round(config.get("twist_threshold", 400) * gyro_scale)
+    TWIST_TOLERANCE = round(config.get("twist_tolerance", 150) * gyro_scale)
+    TWIST_RELEASE = round(config.get("twist_release", 2) * gyro_scale)
+    IDLE_GYRO_THRESHOLD = round(20 * gyro_scale)
+
+    # swing magnitudes square counts shifted right by 2 to stay small ints
+    swing_full_scale = round((config.get("swing_speed", 316) * gyro_scale / 4) ** 2)
+    # swing magnitude per step of the level tables
+    SWING_STEP_SIZE = max(swing_full_scale // (SWING_STEPS - 1), 1)
+    # summed rotation where swingl and swingh cross over, 20000 for 90 degrees
+    ROTATION_STEPS = [round(step * gyro_scale) for step in (20000, 30000, 60000, 80000)]
+    # clash_threshold is a rate of change of |accel|^2 / 10 in (m/s^2)^2 per second,
+    # converted to the change between two samples SENSE_PERIOD_MS apart
+    per_sample = (
+        10 * (accel_scale / (1 << MAGNITUDE_SHIFT)) ** 2 * SENSE_PERIOD_MS / 1000
+    )
+    CLASH_DETECTOR = ClashDetector(
+        round(CLASH_THRESHOLD * per_sample), CLASH_REFRACTORY_MS // SENSE_PERIOD_MS
+    )
+    # shaking the hilt this hard while choosing a profile steps the volume
+    SHAKE_DETECTOR = ClashDetector(
+        round(500 * per_sample), SHAKE_REFRACTORY_MS // SENSE_PERIOD_MS
+    )
+
+
+def play_hum():
+    global HUM_STARTED
+
+    play(0, PROFILE.sound(PROFILE.hum), loop=True)
+    HUM_STARTED = supervisor.ticks_ms()
+
+
+# the swing speed is quantised to SWING_STEPS steps from still to swing_speed, and
+# the hum, swingl and swingh levels at each step are looked up in tables built when
+# a profile is loaded. Below SWING_REST_STEP the hilt counts as still, below
+# SWING_LOW_STEP the swing rotation is reset, and from SWING_HIGH_STEP turning the
+# hilt crossfades swingl and swingh
+SWING_STEPS = 256
+SWING_REST_STEP = math.ceil(0.01 * (SWING_STEPS - 1))
+SWING_LOW_STEP = math.ceil(0.3 * (SWING_STEPS - 1))
+SWING_HIGH_STEP = math.ceil(0.7 * (SWING_STEPS - 1))
+
+
+def default_hum_level(x):
+    return -0.30 * math.sin(6 * x + 5) + 0.5
+
+
+def default_swingl_level(x):
+    if x < 0.3:
+        return 0.4 * math.sin(10 * x + 4.9) + 0.393
+    elif x < 0.7:
+        return -1.976 * x + 1.385
+    return 0
+
+
+def default_swingh_level(x):
+    if x < 0.3:
+        return 0
+    elif x < 0.7:
+        return 1.976 * x - 0.59
+    return 1
+
+
+def curve_level(points, x):
+    # the level at x on the straight lines joining [x, level] points
+    if x <= points[0][0]:
+        return points[0][1]
+    for i in range(1, len(points)):
+        (x1, level1) = points[i]
+        if x <= x1:
+            (x0, level0) = points[i - 1]
+            return level0 + (level1 - level0) * (x - x0) / (x1 - x0)
+    return points[-1][1]
+
+
+def level_table(curve):
+    # the level at every swing step of a curve, either a function of the swing
+    # speed from 0 to 1 or the [x, level] points of a profile config.json curve
+    table = array("f", [0] * SWING_STEPS)
+    for step in range(SWING_STEPS):
+        x = step / (SWING_STEPS - 1)
+        level = curve(x) if callable(curve) else curve_level(curve, x)
+        table[step] = min(max(level, 0), 1)
+    return table
+
+
+# keep this many recently used profiles loaded for instant switching, as long as
+# at least PROFILE_CACHE_MIN_FREE bytes of memory stay free
+PROFILE_CACHE_SIZE = 2
+PROFILE_CACHE_MIN_FREE = 40 * 1024
+
+# profiles are loaded from /sd/profiles/ on an SD card on SPI0 when one is inserted,
+# otherwise from /profiles/ on the internal flash
+FLASH_PROFILES_PATH = "/profiles/"
+SD_MOUNT_POINT = "/sd"
+SD_CLOCK = board.GP18
+SD_MOSI = board.GP19
+SD_MISO = board.GP16
+SD_CS = board.GP17
+# bytes per second the mixer streams with every voice playing, and how many times
+# that the card has to read in the startup benchmark to be used, leaving room for
+# the rest of the loop
+STREAM_RATE = num_voices * mixer.sample_rate * 2
+SD_RATE_MARGIN = 2
+
+
+def profile_folders(path):
+    # the non-empty folders in path, skipping files and the dot-files and folders
+    # computers leave on removable drives
+    folders = []
+    for name in sorted(listdir(path)):
+        if name.startswith(".") or not stat(path + name)[0] & 0x4000:
+            continue
+        if listdir(path + name):
+            folders.append(name)
+    return folders
+
+
+def has_profiles(path):
+    try:
+        return bool(profile_folders(path))
+    except OSError:
+        return False
+
+
+def find_profiles_path():
+    spi = busio.SPI(SD_CLOCK, MOSI=SD_MOSI, MISO=SD_MISO)
+    if not mount_sd(spi, SD_CS, SD_MOUNT_POINT):
+        return FLASH_PROFILES_PATH
+    sd_path = SD_MOUNT_POINT + FLASH_PROFILES_PATH
+    if not has_profiles(sd_path):
+        print(f"No profiles found at {sd_path}")
+        return FLASH_PROFILES_PATH
+
+    # read as many sounds of the first profile at once as the mixer has voices
+    for name in profile_folders(sd_path):
+        folder = sd_path + name + "/"
+        sounds = [
+            folder + file
+            for file in listdir(folder)
+            if file.endswith(".wav") and not file.startswith(".")
+        ]
+        if sounds:
+            break
+    else:
+        print(f"No sounds found at {sd_path}")
+        return sd_path
+    rate = read_rate(sounds[:num_voices], bytearray(WAVE_BUFFER_SIZE))
+    print(
+        f"SD card reads {rate // 1024} KB/s, "
+        f"{num_voices} voices stream {STREAM_RATE // 1024} KB/s"
+    )
+    if rate < STREAM_RATE * SD_RATE_MARGIN and has_profiles(FLASH_PROFILES_PATH):
+        print("SD card is too slow for every voice, using the internal flash")
+        return FLASH_PROFILES_PATH
+    return sd_path
+
+
+profiles_path = find_profiles_path()
+# profiles/manifest.json is written by tools/build_manifest.py, without it every
+# profile folder is listed when it is loaded
+MANIFEST = load_manifest(profiles_path)
+PROFILES = ProfileCache(PROFILE_CACHE_SIZE, PROFILE_CACHE_MIN_FREE, MANIFEST, SOUNDS)
+
 
 def load_profile(profile_directory):
-    global swingl
-    global swingh
-    global clsh
-    global blade_in
-    global blade_out
-    global hum_wav
-    global select_wav
+    # browsing a profile only reads its settings, its sounds are opened when they
+    # are first played
+    global PROFILE
+    global SHIMMER_TABLE
+    global HUM_LEVELS
+    global SWINGL_LEVELS
+    global SWINGH_LEVELS
+    global SHIMMER_LOOP_MS
 
     global WINDOW_SIZE
     global FLASH_WINDOW_SIZE_MIN
@@ -71,100 +392,72 @@ def load_profile(profile_directory):
     global COLOR
     global AUGMENTED_COLOR
     global CLASH_THRESHOLD
+    global EXTEND_TIME
+    global RETRACT_TIME
+    global SHIMMER_PALETTE
+
+    PROFILE = PROFILES.get(profile_directory)
 
     # read setting options
-    with open(profile_directory + "config.json", "r") as file:
-        config = json.load(file)
-
-        WINDOW_SIZE = config["extension_window_size"]
-        FLASH_WINDOW_SIZE_MIN = config["flash_window_size_min"]
-        FLASH_WINDOW_SIZE_MAX = config["flash_window_size_max"]
-        FLASH_RANGE_OFFSET = config["flash_range_offset"]
-        COLOR = config["color"]
-        AUGMENTED_COLOR = config["augmented_color"]
-        CLASH_THRESHOLD = config["clash_threshold"]
-
-    hum_wav = audiocore.WaveFile(open(profile_directory + "hum01.wav", "rb"))
-    select_wav = audiocore.WaveFile(open(profile_directory + "select.wav", "rb"))
-
-    mixer.voice[0].play(hum_wav, loop=True)
-
-    swingl_files_count = 0
-    swingh_files_count = 0
-    clsh_files_count = 0
-    in_files_count = 0
-    out_files_count = 0
-
-    for filename in listdir(profile_directory):
-        if filename.startswith("swingl"):
-            swingl_files_count += 1
-        if filename.startswith("swingh"):
-            swingh_files_count += 1
-        if filename.startswith("clsh"):
-            clsh_files_count += 1
-        if filename.startswith("in"):
-            in_files_count += 1
-        if filename.startswith("out"):
-            out_files_count += 1
-
-    if swingl_files_count != swingh_files_count:
-        print("swingh and swingl must come in pairs")
-
-    swingl = [0] * swingl_files_count
-    swingh = [0] * swingh_files_count
-    clsh = [0] * clsh_files_count
-    blade_in = [0] * in_files_count
-    blade_out = [0] * out_files_count
-
-    for filename in listdir(profile_directory):
-        if filename.endswith(".wav") and filename.startswith("swingl"):
-            number = int(filename[6:8]) - 1
-            file_path = profile_directory + filename
-            print(f"loading file {filename} into swingl with number {number}")
-            swingl[int(number)] = audiocore.WaveFile(open(file_path, "rb"))
-        if filename.endswith(".wav") and filename.startswith("swingh"):
-            number = int(filename[6:8]) - 1
-            file_path = profile_directory + filename
-            print(f"loading file {filename} into swingh with number {number}")
-            swingh[int(number)] = audiocore.WaveFile(open(file_path, "rb"))
-        if filename.endswith(".wav") and filename.startswith("clsh"):
-            number = int(filename[4:6]) - 1
-            file_path = profile_directory + filename
-            print(f"loading file {filename} into clsh with number {number}")
-            clsh[int(number)] = audiocore.WaveFile(open(file_path, "rb"))
-        if filename.endswith(".wav") and filename.startswith("in"):
-            number = int(filename[2:4]) - 1
-            file_path = profile_directory + filename
-            print(f"loading file {filename} into blade_in with number {number}")
-            blade_in[int(number)] = audiocore.WaveFile(open(file_path, "rb"))
-        if filename.endswith(".wav") and filename.startswith("out"):
-            number = int(filename[3:5]) - 1
-            file_path = profile_directory + filename
-            print(f"loading file {filename} into blade_out with number {number}")
-            blade_out[int(number)] = audiocore.WaveFile(open(file_path, "rb"))
-
-    print(swingl)
-    print(swingh)
-    print(clsh)
-    print(blade_in)
-    print(blade_out)
+    config = PROFILE.config
+    WINDOW_SIZE = config["extension_window_size"]
+    FLASH_WINDOW_SIZE_MIN = config["flash_window_size_min"]
+    FLASH_WINDOW_SIZE_MAX = config["flash_window_size_max"]
+    FLASH_RANGE_OFFSET = config["flash_range_offset"]
+    COLOR = config["color"]
+    AUGMENTED_COLOR = config["augmented_color"]
+    CLASH_THRESHOLD = config["clash_threshold"]
+    # milliseconds the blade takes to extend and retract, to match the sounds
+    EXTEND_TIME = config.get("extend_time", 600)
+    RETRACT_TIME = config.get("retract_time", 1000)
+
+    # the palette and level tables are built the first time a profile is loaded and
+    # kept with it, so switching back to a cached profile only swaps them in.
+    # hum_curve, swingl_curve and swingh_curve replace the default level curves
+    if PROFILE.derived is None:
+        PROFILE.derived = (
+            shimmer_palette(COLOR, AUGMENTED_COLOR, config.get("shimmer_depth", 0.25)),
+            level_table(config.get("hum_curve", default_hum_level)),
+            level_table(config.get("swingl_curve", default_swingl_level)),
+            level_table(config.get("swingh_curve", default_swingh_level)),
+        )
+    (SHIMMER_PALETTE, HUM_LEVELS, SWINGL_LEVELS, SWINGH_LEVELS) = PROFILE.derived
+
+    configure_sensor(config)
+    load_thresholds(config)
+
+    SHIMMER_TABLE = PROFILE.shimmer_table
+    SHIMMER_LOOP_MS = PROFILE.shimmer_loop_ms
+
+
+def start_profile():
+    # committing to the loaded profile opens its hum and first swing pair
+    play_hum()
+    (low, high) = PROFILE.swing_pair(0)
+    play(1, low, loop=True)
+    play(2, high, loop=True)
 
 
 def get_wav_file(file_type):
     if file_type == "swing":
-        file_number = randint(0, len(swingl) - 1)
-        # print(file_number)
-        return (swingl[file_number], swingh[file_number])
+        return PROFILE.swing_pair()
     elif file_type == "clash":
-        file_number = randint(0, len(clsh) - 1)
-        # print(file_number)
-        return clsh[file_number]
+        return PROFILE.pick("clsh")
     elif file_type == "in":
-        file_number = randint(0, len(blade_in) - 1)
-        return blade_in[file_number]
+        return PROFILE.pick("blade_in")
     elif file_type == "out":
-        file_number = randint(0, len(blade_out) - 1)
-        return blade_out[file_number]
+        return PROFILE.pick("blade_out")
+
+
+async def idle():
+    # park the IMU in low power wake-on-motion mode until the hilt is moved or the
+    # button is pressed
+    LOG.info("idling")
+    mpu.enable_wake_on_motion()
+    while not int_pin.value and pin.value:
+        await asyncio.sleep(0.05)
+    mpu.disable_wake_on_motion()
+    LOG.info("waking up")
 
 
 def get_next_line(file_handler):
@@ -175,100 +468,103 @@ def get_next_line(file_handler):
 
 
 def get_available_profiles():
+    if MANIFEST is not None:
+        return MANIFEST.names
+
     # List folders in /profiles/
-    available_profiles = [
-        folder for folder in listdir(profiles_path) if listdir(profiles_path + folder)
-    ]
-    return available_profiles
+    return profile_folders(profiles_path)
+
+
+def profile_exists(profile_name):
+    if MANIFEST is not None:
+        return profile_name in MANIFEST.names
+    try:
+        return bool(listdir(profiles_path + profile_name))
+    except OSError:
+        return False
 
 
 def save_selection(profile_name):
     global VOLUME
 
-    print(f"Saving active profile {profile_name} and volume {VOLUME}")
+    LOG.info("saving active profile and volume", profile_name, VOLUME)
     with open("/config.txt", "w") as file:
         file.write(profile_name + "\n")
         file.write(str(VOLUME) + "\n")
 
 
-def select_profile():
-    global mpu
-    global mixer
-    global last_accel
-    global last_timestamp
+def step_volume():
+    # move to the next volume and announce it, returning how many milliseconds the
+    # announcement plays before the new volume takes effect
     global VOLUME
-    global select_wav
+
+    if VOLUME == 0:
+        VOLUME = 0.25
+        mixer.voice[3].level = 0.25
+        play(3, SOUNDS.get("/other_sounds/volume_25.wav"))
+        LOG.info("volume 25")
+    elif VOLUME == 0.25:
+        VOLUME = 0.50
+        play(3, SOUNDS.get("/other_sounds/volume_50.wav"))
+        LOG.info("volume 50")
+    elif VOLUME == 0.50:
+        VOLUME = 0.75
+        play(3, SOUNDS.get("/other_sounds/volume_75.wav"))
+        LOG.info("volume 75")
+    elif VOLUME == 0.75:
+        VOLUME = 1
+        play(3, SOUNDS.get("/other_sounds/volume_100.wav"))
+        LOG.info("volume 100")
+    elif VOLUME == 1:
+        VOLUME = 0
+        mixer.voice[3].level = 0.25
+        play(3, SOUNDS.get("/other_sounds/volume_0.wav"))
+        LOG.info("volume 0")
+        return 2500
+    return 500
+
+
+async def select_profile():
+    # cycle through the profiles with short presses while the motion task steps
+    # the volume on shakes, until the button is held to keep the current profile
+    global SELECTING
+    global SELECTED_PROFILE
     global COLOR
-    global STRIP
-    global STRIP2
-    global volume_0_wav
-    global volume_25_wav
-    global volume_50_wav
-    global volume_75_wav
-    global volume_100_wav
 
+    SELECTING = True
+    SHAKE_DETECTOR.reset()
     count_button_hold = 0
     current_selection = 0
     last_iter_button_pressed = False
 
+    # stop the hum and swings so their files can be closed while browsing
+    for voice in range(3):
+        mixer.voice[voice].stop()
+
     available_profiles = get_available_profiles()
-    selected_profile = available_profiles[0]
     if mixer.voice[3].level == 0:
         mixer.voice[3].level = 0.25
-    load_profile("/profiles/" + available_profiles[current_selection] + "/")
-    STRIP.fill(COLOR)
-    STRIP2.fill(COLOR)
-    mixer.voice[3].play(select_wav)
+    load_profile(profiles_path + available_profiles[current_selection] + "/")
+    sense_timer.period_ms = RETRACTED_SENSE_PERIOD_MS
+    blade.fill(COLOR)
+    play(3, PROFILE.sound(PROFILE.select))
 
     while not pin.value:
-        pass
+        await asyncio.sleep(0.01)
 
     while True:
-        accel = mpu.acceleration
-        accel_magnitude = (accel[0] ** 2 + accel[1] ** 2 + accel[2] ** 2) / 10
-        current_timestamp = time.monotonic()
-        d_accel = (accel_magnitude - last_accel) / (current_timestamp - last_timestamp)
-        d_accel_pos = abs(d_accel)
-        last_accel = accel_magnitude
-        last_timestamp = current_timestamp
-
-        if d_accel_pos >= 500:
-            if VOLUME == 0:
-                VOLUME = 0.25
-                mixer.voice[3].level = 0.25
-                mixer.voice[3].play(volume_25_wav)
-                print("volume 25")
-            elif VOLUME == 0.25:
-                VOLUME = 0.50
-                mixer.voice[3].play(volume_50_wav)
-                print("volume 50")
-            elif VOLUME == 0.50:
-                VOLUME = 0.75
-                mixer.voice[3].play(volume_75_wav)
-                print("volume 75")
-            elif VOLUME == 0.75:
-                VOLUME = 1
-                mixer.voice[3].play(volume_100_wav)
-                print("volume 100")
-            elif VOLUME == 1:
-                VOLUME = 0
-                mixer.voice[3].level = 0.25
-                mixer.voice[3].play(volume_0_wav)
-                time.sleep(2)
-                print("volume 0")
-            time.sleep(0.5)
-            mixer.voice[3].level = VOLUME
-
         if not pin.value:
             last_iter_button_pressed = True
             count_button_hold += 1
 
             if count_button_hold == 50:
-                save_selection(available_profiles[current_selection])
-                STRIP.fill(BLACK)
-                STRIP2.fill(BLACK)
+                SELECTED_PROFILE = available_profiles[current_selection]
+                save_requested.set()
+                blade.fill(BLACK)
+                start_profile()
                 while not pin.value:
-                    pass
+                    await asyncio.sleep(0.01)
+                SELECTING = False
                 return
         elif pin.value and last_iter_button_pressed:
             last_iter_button_pressed = False
@@ -276,11 +572,11 @@ def select_profile():
             current_selection = current_selection % len(available_profiles)
             if mixer.voice[3].level == 0:
                 mixer.voice[3].level = 0.25
-            load_profile("/profiles/" + available_profiles[current_selection] + "/")
-            mixer.voice[3].play(select_wav)
-            STRIP.fill(COLOR)
-            STRIP2.fill(COLOR)
-        time.sleep(0.05)
+            load_profile(profiles_path + available_profiles[current_selection] + "/")
+            sense_timer.period_ms = RETRACTED_SENSE_PERIOD_MS
+            play(3, PROFILE.sound(PROFILE.select))
+            blade.fill(COLOR)
+        await asyncio.sleep(0.05)
 
 
 # Read configuration
@@ -289,11 +585,10 @@ with open("/config.txt", "r") as file:
     VOLUME = float(get_next_line(file))
 
 mixer.voice[3].level = VOLUME
-profiles_path = "/profiles/"
 profile_path = profiles_path + profile  # Joining path manually
 
 # Verify if profile folder exists
-if not listdir(profile_path):
+if not profile_exists(profile):
     print(f"No profile found at {profile_path}.")
 
     available_profiles = get_available_profiles()
@@ -308,10 +603,7 @@ print(f"Using profile: {profile}")
 profile_path = profile_path + "/"
 
 load_profile(profile_path)
-
-mixer.voice[0].play(hum_wav, loop=True)
-mixer.voice[1].play(swingl[0], loop=True)
-mixer.voice[2].play(swingh[0], loop=True)
+start_profile()
 
 # initialize strip options
 PIXEL_COUNT = 115
@@ -319,101 +611,78 @@ DATA_PIN = board.GP2
 SECOND_DATA_PIN = board.GP3
 BLACK = (0, 0, 0)
 
-STRIP = neopixel.NeoPixel(
-    DATA_PIN,
-    PIXEL_COUNT,
-    bpp=3,
-    brightness=1,
-    auto_write=True,
-    pixel_order=neopixel.GRB,
-)
-STRIP2 = neopixel.NeoPixel(
-    SECOND_DATA_PIN,
+
+def strip_pin(data_pin):
+    output = digitalio.DigitalInOut(data_pin)
+    output.direction = digitalio.Direction.OUTPUT
+    return output
+
+
+# both strips run from the hilt to the tip with a segment of the frame each, so a
+# clash can flash a different stretch on either side of the blade. Strips showing
+# the same pixels can share the segment (0, False) and halve the drawing work
+blade = Blade(
+    (strip_pin(DATA_PIN), strip_pin(SECOND_DATA_PIN)),
     PIXEL_COUNT,
-    bpp=3,
-    brightness=1,
-    auto_write=True,
-    pixel_order=neopixel.GRB,
+    segments=((0, False), (PIXEL_COUNT, False)),
 )
 
 
-def extend():
-    global STRIP
-    global STRIP2
-    global WINDOW_SIZE
-    global AUGMENTED_COLOR
-    global VOLUME
+async def wait_for_blade():
+    while blade.busy:
+        await asyncio.sleep(LED_PERIOD_MS / 1000)
 
-    # ensure strip is black before extending
-    STRIP.fill(BLACK)
-    STRIP2.fill(BLACK)
+
+async def extend():
+    global VOLUME
 
     mixer.voice[0].level = 0
     mixer.voice[1].level = 0
     mixer.voice[2].level = 0
 
     mixer.voice[3].level = VOLUME
-    mixer.voice[3].play(get_wav_file("out"))
-
-    for i in range(-WINDOW_SIZE, PIXEL_COUNT - 2, 3):
-        # set start of window to augmented color
-        start_of_window = min(i + WINDOW_SIZE, PIXEL_COUNT - 3)
-        end_of_window = max(max(i, 0), 0)
-        STRIP[start_of_window : start_of_window + 3] = (AUGMENTED_COLOR,) * 3
-        STRIP2[start_of_window : start_of_window + 3] = (AUGMENTED_COLOR,) * 3
-        # set end of window to normal color
-        STRIP[end_of_window : end_of_window + 3] = (COLOR,) * 3
-        STRIP2[end_of_window : end_of_window + 3] = (COLOR,) * 3
-
-
-def retract():
-    global STRIP
-    global STRIP2
-    global VOLUME
+    play(3, get_wav_file("out"))
+
+    # ensure strip is black before extending
+    blade.fill(BLACK)
+    blade.play(
+        Ignition(COLOR, AUGMENTED_COLOR, WINDOW_SIZE, EXTEND_TIME),
+        supervisor.ticks_ms(),
+    )
+    await wait_for_blade()
+
 
-    STRIP.fill(COLOR)
-    STRIP2.fill(COLOR)
+async def retract():
+    global VOLUME
 
     mixer.voice[0].level = 0
     mixer.voice[1].level = 0
     mixer.voice[2].level = 0
 
     mixer.voice[3].level = VOLUME
-    mixer.voice[3].play(get_wav_file("in"))
+    play(3, get_wav_file("in"))
 
-    step = -3
-    for i in range(PIXEL_COUNT - 3, -1, step):
-        STRIP[i] = BLACK
-        STRIP2[i] = BLACK
-        STRIP[i + 1] = BLACK
-        STRIP2[i + 1] = BLACK
-        STRIP[i + 2] = BLACK
-        STRIP2[i + 2] = BLACK
-
-    STRIP[0] = BLACK
-    STRIP2[0] = BLACK
+    blade.play(Retraction(COLOR, RETRACT_TIME), supervisor.ticks_ms())
+    await wait_for_blade()
 
 
 def clash():
-    global STRIP
-    global STRIP2
     global AUGMENTED_COLOR
     global COLOR
     global mixer
-    global wave3
     global VOLUME
     global FLASH_RANGE_OFFSET
     global FLASH_WINDOW_SIZE_MAX
     global FLASH_WINDOW_SIZE_MIN
 
     bright_point = randint(FLASH_RANGE_OFFSET, PIXEL_COUNT - FLASH_RANGE_OFFSET - 1)
-    flash_window_size = randint(FLASH_WINDOW_SIZE_MIN, FLASH_WINDOW_SIZE_MAX)
-
-    end_tip = min(bright_point + flash_window_size, PIXEL_COUNT - 1)
-    beginning_tip = max(bright_point - flash_window_size, 0)
-    STRIP[bright_point:end_tip] = (AUGMENTED_COLOR,) * (end_tip - bright_point)
-    STRIP2[beginning_tip:bright_point] = (AUGMENTED_COLOR,) * (
-        bright_point - beginning_tip
+    # a clash twice as hard as clash_threshold or harder flashes the widest window
+    flash_window_size = FLASH_WINDOW_SIZE_MIN + round(
+        (FLASH_WINDOW_SIZE_MAX - FLASH_WINDOW_SIZE_MIN) * min(CLASH_INTENSITY - 1, 1)
+    )
+    blade.play(
+        Flash(COLOR, AUGMENTED_COLOR, bright_point, flash_window_size, CLASH_FLASH_MS),
+        supervisor.ticks_ms(),
     )
 
     mixer.voice[0].level = 0.5
@@ -421,57 +690,47 @@ def clash():
     mixer.voice[2].level = 0
 
     mixer.voice[3].level = VOLUME
-    mixer.voice[3].play(get_wav_file("clash"))
-
-    time.sleep(0.25)
-    STRIP.fill(COLOR)
-    STRIP2.fill(COLOR)
+    play(3, get_wav_file("clash"))
 
 
 axis_1_3_rotation = 0
 
 
-def handle_audio(x):  # calculate hum magnitude
+def handle_audio(step):  # look up the levels at the quantised swing speed
     global mixer
     global axis_1_3_rotation
     global VOLUME
 
-    y_at_x = -0.30 * math.sin(6 * x + 5) + 0.5
-
-    # calculate swingl magnitude
-    if 0 < x < 0.3:
-        f_at_x = 0.4 * math.sin(10 * x + 4.9) + 0.393
-    elif 0.3 <= x < 0.7:
-        f_at_x = -1.976 * x + 1.385
-    else:
-        f_at_x = 0
+    y_at_x = HUM_LEVELS[step]
+    f_at_x = SWINGL_LEVELS[step]
+    g_at_x = SWINGH_LEVELS[step]
 
-    # calculate swingh magnitude
-    if 0 < x < 0.3:
-        g_at_x = 0
+    if step < SWING_LOW_STEP:
         axis_1_3_rotation = 0
-    elif 0.3 <= x < 0.7:
-        g_at_x = 1.976 * x - 0.59
-    else:
-        g_at_x = 1
-        axis_1_3_rotation += abs(gyro[0]) + abs(gyro[2])
+    elif step >= SWING_HIGH_STEP:
+        axis_1_3_rotation += abs(RAW[3]) + abs(RAW[5])
         # print(axis_1_3_rotation)
 
-        # change g_x and f_x according to how many degrees of rotation was recorded, 20000 for 90 degrees
-        if 20000 <= axis_1_3_rotation and axis_1_3_rotation < 30000:
-            pitch_phase = (axis_1_3_rotation - 20000) / 10000
+        # change g_x and f_x according to how many degrees of rotation was recorded
+        if ROTATION_STEPS[0] <= axis_1_3_rotation < ROTATION_STEPS[1]:
+            pitch_phase = (axis_1_3_rotation - ROTATION_STEPS[0]) / (
+                ROTATION_STEPS[1] - ROTATION_STEPS[0]
+            )
             f_at_x = pitch_phase
             g_at_x = 1 - pitch_phase
-        elif 30000 <= axis_1_3_rotation < 60000:
+        elif ROTATION_STEPS[1] <= axis_1_3_rotation < ROTATION_STEPS[2]:
             f_at_x = 1
             g_at_x = 0
-        elif 60000 <= axis_1_3_rotation and axis_1_3_rotation < 80000:
-            pitch_phase = (axis_1_3_rotation - 60000) / 20000
+        elif ROTATION_STEPS[2] <= axis_1_3_rotation < ROTATION_STEPS[3]:
+            pitch_phase = (axis_1_3_rotation - ROTATION_STEPS[2]) / (
+                ROTATION_STEPS[3] - ROTATION_STEPS[2]
+            )
             f_at_x = 1 - pitch_phase
             g_at_x = pitch_phase
             axis_1_3_rotation = 0
 
-    print(y_at_x, f_at_x, g_at_x, axis_1_3_rotation)
+    if LOG.level <= DEBUG:
+        LOG.debug("levels", y_at_x, f_at_x, g_at_x, axis_1_3_rotation)
     mixer.voice[0].level = y_at_x * VOLUME
     mixer.voice[1].level = f_at_x * VOLUME
     mixer.voice[2].level = g_at_x * VOLUME
@@ -479,74 +738,264 @@ def handle_audio(x):  # calculate hum magnitude
 
 # initialize loop variables
 IS_TURNED_ON = False
+SELECTING = False
+SELECTED_PROFILE = profile
 CONSECUTIVE_ROTATION = 0
 VALID_TURNS = 0
 
-last_timestamp = time.monotonic()
-last_accel = 0
+# park the IMU after this many seconds retracted without the hilt turning faster
+# than IDLE_GYRO_THRESHOLD on any axis
+IDLE_TIMEOUT = 10
+last_motion = time.monotonic()
+
+# raw accelerometer X, Y, Z and gyroscope X, Y, Z counts of the latest sample
+RAW = array("h", [0] * 6)
+# every sample queued in the IMU FIFO since the last read, as many as it holds
+FRAMES = bytearray(42 * FIFO_FRAME_SIZE)
+FRAME_COUNT = 0
+# how hard the last detected clash was, as a multiple of clash_threshold
+CLASH_INTENSITY = 1
+
+# fixed periods in milliseconds of updating the mixer levels and drawing LED
+# frames, which caps the frame rate at 50 per second (the IMU periods come from the
+# profile sample rate). ROTATION_STEPS are tuned for a 10 ms audio period
+AUDIO_PERIOD_MS = 10
+LED_PERIOD_MS = 20
+CLASH_FLASH_MS = 250
+# hold the button this long while the blade is retracted to choose a profile
+PROFILE_HOLD_MS = 1000
+volume_end = None
+swing = 0
+
+sense_timer = Periodic(RETRACTED_SENSE_PERIOD_MS)
+audio_timer = Periodic(AUDIO_PERIOD_MS)
+led_timer = Periodic(LED_PERIOD_MS)
+TIMERS = (sense_timer, audio_timer, led_timer)
+
+# a new sample is in RAW
+sample_ready = asyncio.Event()
+# the hilt asks for a clash flash
+clash_event = asyncio.Event()
+# the blade should extend or retract, cleared once it has
+toggle_blade = asyncio.Event()
+# the profile selection should be written to flash
+save_requested = asyncio.Event()
+# the sensor task should park the IMU until the hilt moves
+park = asyncio.Event()
+
+
+def reset_timers():
+    # start the deadlines over after blocking on purpose, so the wait does not
+    # count as overruns
+    for timer in TIMERS:
+        timer.reset()
+
+
+def report_timers():
+    LOG.info("sense", sense_timer)
+    LOG.info("audio", audio_timer)
+    LOG.info("leds", led_timer)
+
+
+async def read_sensor():
+    global last_motion
+    global FRAME_COUNT
 
-min_accel = 0
-max_accel = 0
-count_button_hold = 0
-while True:
-    gyro = mpu.gyro
-    accel = mpu.acceleration
+    while True:
+        await sense_timer.wait()
+        if park.is_set():
+            await idle()
+            mpu.fifo = True  # drop what was queued while parked
+            park.clear()
+            last_motion = time.monotonic()
+            reset_timers()
+        FRAME_COUNT = mpu.read_fifo(FRAMES)
+        if FRAME_COUNT:
+            unpack_frame(FRAMES, FRAME_COUNT - 1, RAW)
+            sample_ready.set()
+            # let the samples be classified before FRAMES is read into again
+            await asyncio.sleep(0)
+
+
+async def classify_motion():
+    global CONSECUTIVE_ROTATION
+    global VALID_TURNS
+    global last_motion
+    global volume_end
+    global swing
+    global CLASH_INTENSITY
 
-    if gyro[1] < -400 and abs(gyro[0]) < 150 and abs(gyro[2]) < 150:
-        print("turn detected")
-        CONSECUTIVE_ROTATION += 1
-    else:
-        CONSECUTIVE_ROTATION = 0
-        VALID_TURNS -= 1
+    while True:
+        await sample_ready.wait()
+        sample_ready.clear()
+        now = supervisor.ticks_ms()
+
+        if volume_end is not None and ticks_diff(now, volume_end) >= 0:
+            volume_end = None
+            mixer.voice[3].level = VOLUME
+
+        if SELECTING:
+            shake = SHAKE_DETECTOR.add_frames(FRAMES, FRAME_COUNT)
+            if shake and volume_end is None:
+                volume_end = ticks_add(now, step_volume())
+            continue
+
+        if toggle_blade.is_set():
+            continue  # the blade is extending or retracting
+
+        if (
+            RAW[4] < -TWIST_THRESHOLD
+            and abs(RAW[3]) < TWIST_TOLERANCE
+            and abs(RAW[5]) < TWIST_TOLERANCE
+        ):
+            LOG.debug("turn detected")
+            CONSECUTIVE_ROTATION += 1
+        else:
+            CONSECUTIVE_ROTATION = 0
+            VALID_TURNS -= 1
+
+        if CONSECUTIVE_ROTATION >= 3 and not IS_TURNED_ON:
+            VALID_TURNS = 7
+        elif CONSECUTIVE_ROTATION >= 10 and IS_TURNED_ON:
+            VALID_TURNS = 10
+
+        if VALID_TURNS >= 0 and RAW[4] > TWIST_RELEASE:
+            LOG.info("switching state")
+            VALID_TURNS = 0
+            CONSECUTIVE_ROTATION = 0
+            toggle_blade.set()
+        elif IS_TURNED_ON:
+            # handle rotation calculation
+            gyro_x = RAW[3] >> 2
+            gyro_z = RAW[5] >> 2
+            gyro_magnitude = gyro_x * gyro_x + gyro_z * gyro_z
+
+            last_swing = swing
+            swing = min(gyro_magnitude // SWING_STEP_SIZE, SWING_STEPS - 1)
+            # pick the next swing pair once the hilt comes to rest, opening it
+            # while the swing voices are silent
+            if swing < SWING_REST_STEP <= last_swing:
+                (low, high) = get_wav_file("swing")
+                play(1, low, loop=True)
+                play(2, high, loop=True)
+
+            intensity = CLASH_DETECTOR.add_frames(FRAMES, FRAME_COUNT)
+            if intensity and not blade.busy and not clash_event.is_set():
+                CLASH_INTENSITY = intensity
+                clash_event.set()
+        else:
+            if LOG.level <= DEBUG:
+                LOG.debug("motion", CONSECUTIVE_ROTATION, VALID_TURNS, RAW)
+            if (
+                abs(RAW[3]) > IDLE_GYRO_THRESHOLD
+                or abs(RAW[4]) > IDLE_GYRO_THRESHOLD
+                or abs(RAW[5]) > IDLE_GYRO_THRESHOLD
+            ):
+                last_motion = time.monotonic()
+            elif time.monotonic() - last_motion > IDLE_TIMEOUT:
+                park.set()
+
+
+async def update_audio():
+    while True:
+        await audio_timer.wait()
+        # the hum and swing levels hold still while a clash plays
+        if IS_TURNED_ON and not blade.busy and not toggle_blade.is_set():
+            handle_audio(swing)
 
-    if CONSECUTIVE_ROTATION >= 3 and not IS_TURNED_ON:
-        VALID_TURNS = 7
-    elif CONSECUTIVE_ROTATION >= 10 and IS_TURNED_ON:
-        VALID_TURNS = 10
 
-    if not pin.value:
-        count_button_hold += 1
-    else:
-        count_button_hold = 0
+async def run_leds():
+    while True:
+        await led_timer.wait()
+        if clash_event.is_set():
+            clash_event.clear()
+            clash()
+        blade.update(supervisor.ticks_ms())
+
 
-    if count_button_hold >= 3 and not IS_TURNED_ON:
-        select_profile()
+async def run_blade():
+    global IS_TURNED_ON
+    global last_motion
 
-    if VALID_TURNS >= 0 and gyro[1] > 2 or not pin.value:
-        print("switching state")
-        VALID_TURNS = 0
-        CONSECUTIVE_ROTATION = 0
+    while True:
+        await toggle_blade.wait()
+        clash_event.clear()
         if IS_TURNED_ON:
             IS_TURNED_ON = False
-            retract()
+            blade.background = None
+            await retract()
+            report_timers()
+            sense_timer.period_ms = RETRACTED_SENSE_PERIOD_MS
         else:
             IS_TURNED_ON = True
-            extend()
-
-    if IS_TURNED_ON:
-        # handle rotation calculation
-        gyro_magnitude = gyro[0] ** 2 + gyro[2] ** 2
-
-        # handle acceleration calculation
-        accel_magnitude = (accel[0] ** 2 + accel[1] ** 2 + accel[2] ** 2) / 10
-        current_timestamp = time.monotonic()
-        d_accel = (accel_magnitude - last_accel) / (current_timestamp - last_timestamp)
-        d_accel_pos = abs(d_accel)
-        last_accel = accel_magnitude
-        last_timestamp = current_timestamp
-
-        x = max(min(gyro_magnitude / 100000, 1), 0)
-        if x < 0.01:
-            (low, high) = get_wav_file("swing")
-            mixer.voice[1].play(low, loop=True)
-            mixer.voice[2].play(high, loop=True)
-
-        if d_accel_pos > CLASH_THRESHOLD:
-            clash()
+            sense_timer.period_ms = SENSE_PERIOD_MS
+            await extend()
+            CLASH_DETECTOR.reset()
+            if SHIMMER_TABLE:
+                blade.background = Shimmer(
+                    SHIMMER_TABLE, SHIMMER_PALETTE, SHIMMER_LOOP_MS, HUM_STARTED
+                )
+        last_motion = time.monotonic()
+        toggle_blade.clear()
+
+
+async def watch_button():
+    # a press retracts the blade, and while it is retracted a short press extends
+    # it and holding for PROFILE_HOLD_MS starts the profile selection
+    global last_motion
+
+    while True:
+        await asyncio.sleep(0.01)
+        if pin.value:
+            continue
+
+        if IS_TURNED_ON:
+            toggle_blade.set()
         else:
-            handle_audio(x)
+            pressed = supervisor.ticks_ms()
+            while (
+                not pin.value
+                and ticks_diff(supervisor.ticks_ms(), pressed) < PROFILE_HOLD_MS
+            ):
+                await asyncio.sleep(0.01)
+            if pin.value:
+                toggle_blade.set()
+            else:
+                await select_profile()
+                last_motion = time.monotonic()
+                reset_timers()
+
+        while not pin.value:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)  # debounce the release
+
+
+async def persist():
+    while True:
+        await save_requested.wait()
+        save_requested.clear()
+        save_selection(SELECTED_PROFILE)
 
-        time.sleep(0.01)
-    else:
-        print(CONSECUTIVE_ROTATION, VALID_TURNS, gyro)
-        time.sleep(0.05)
+
+async def flush_log():
+    while True:
+        await asyncio.sleep(LOG_FLUSH_MS / 1000)
+        LOG.flush()
+
+
+async def main():
+    mpu.fifo = True
+    reset_timers()
+    await asyncio.gather(
+        asyncio.create_task(read_sensor()),
+        asyncio.create_task(classify_motion()),
+        asyncio.create_task(update_audio()),
+        asyncio.create_task(run_leds()),
+        asyncio.create_task(run_blade()),
+        asyncio.create_task(watch_button()),
+        asyncio.create_task(persist()),
+        asyncio.create_task(flush_log()),
+    )
+
+
+asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+Leveled logging that stays out of the way of the main loop.
+
+Messages are written to a preallocated ring buffer instead of the serial console,
+and `Logger.flush` copies them out only while a serial console is connected, so a
+slow or absent USB host never blocks a task. Each message is rate limited on its
+own, and messages below the level of the `Logger` are dropped before anything is
+formatted. Where even the call costs too much, check ``logger.level`` first::
+
+    if LOG.level <= DEBUG:
+        LOG.debug("levels", hum, low, high)
+"""
+
+import sys
+
+import supervisor
+from scheduler import ticks_diff
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+
+class Logger:
+    """
+    Logs messages at or above ``level`` into a ring buffer of ``size`` bytes, the
+    oldest messages making way for new ones when it is full.
+
+    :param int level: The lowest level logged, `DEBUG`, `INFO`, `WARNING`, `ERROR`
+        or `OFF`
+    :param int size: The size of the ring buffer in bytes
+    :param int interval_ms: The shortest time between two logs of the same message
+    """
+
+    def __init__(self, level=INFO, size=2048, interval_ms=1000):
+        self.level = level
+        self.interval_ms = interval_ms
+        self.buffer = bytearray(size)
+        self.start = 0
+        self.length = 0
+        self.dropped = 0  # bytes of messages lost to a full buffer
+        self.suppressed = 0  # messages skipped by the rate limit
+        self._last = {}  # message -> supervisor.ticks_ms() it was last logged
+
+    def log(self, level, message, *values):
+        """Log ``message`` followed by ``values`` if ``level`` is enabled and
+        ``message`` was not logged in the last ``interval_ms``.
+
+        :param int level: The level of the message
+        :param str message: The message, also the key it is rate limited by
+        :param values: Values to append to the message
+        """
+        if level < self.level:
+            return
+        now = supervisor.ticks_ms()
+        last = self._last.get(message)
+        if last is not None and ticks_diff(now, last) < self.interval_ms:
+            self.suppressed += 1
+            return
+        self._last[message] = now
+
+        line = _NAMES.get(level, "LOG") + " " + message
+        for value in values:
+            line += " " + str(value)
+        self._write((line + "\n").encode())
+
+    def debug(self, message, *values):
+        """Log at `DEBUG`, see `log`"""
+        self.log(DEBUG, message, *values)
+
+    def info(self, message, *values):
+        """Log at `INFO`, see `log`"""
+        self.log(INFO, message, *values)
+
+    def warning(self, message, *values):
+        """Log at `WARNING`, see `log`"""
+        self.log(WARNING, message, *values)
+
+    def error(self, message, *values):
+        """Log at `ERROR`, see `log`"""
+        self.log(ERROR, message, *values)
+
+    def flush(self):
+        """Write the buffered messages to the serial console and empty the buffer,
+        if a console is connected. Call from a task, not a hot path."""
+        if not self.length or not supervisor.runtime.serial_connected:
+            return
+        if self.dropped:
+            sys.stdout.write(f"({self.dropped} bytes of log dropped)\n")
+            self.dropped = 0
+        end = self.start + self.length
+        size = len(self.buffer)
+        text = bytes(self.buffer[self.start : min(end, size)])
+        if end > size:
+            text += self.buffer[: end - size]
+        self.start = 0
+        self.length = 0
+        sys.stdout.write(text.decode())
+
+    def _write(self, data):
+        # messages are dropped whole, so flush never writes part of a line
+        size = len(self.buffer)
+        if len(data) > size:
+            self.dropped += len(data)
+            return
+        overflow = self.length + len(data) - size
+        if overflow > 0:
+            # make way up to the end of the message the overflow reaches into, the
+            # buffer always ends with one so this stops
+            while self.buffer[(self.start + overflow - 1) % size] != 10:
+                overflow += 1
+            self.dropped += overflow
+            self.start = (self.start + overflow) % size
+            self.length -= overflow
+
+        position = (self.start + self.length) % size
+        first = min(len(data), size - position)
+        self.buffer[position : position + first] = data[:first]
+        self.buffer[: len(data) - first] = data[first:]
+        self.length += len(data)
@@ -0,0 +1,136 @@
+"""
+Motion features computed from batches of MPU6500 samples.
+
+The sensor queues every sample in its FIFO, and the tasks in ``code.py`` drain it
+once per tick, so a tick may bring several samples or, when it runs late, many.
+`ClashDetector` looks at every one of them in order, so a peak between two ticks is
+not missed and detection does not depend on how regularly the ticks run.
+"""
+
+from array import array
+
+from mpu6500 import FIFO_FRAME_SIZE
+
+# acceleration counts are shifted right by this many bits before squaring, so the
+# magnitudes and their sums stay small integers
+MAGNITUDE_SHIFT = 3
+
+
+def unpack_frame(buffer, frame, raw):
+    """Decode one FIFO frame into the six raw counts of ``raw`` without allocating.
+
+    :param bytearray buffer: The frames read by ``MPU6500.read_fifo``
+    :param int frame: The index of the frame to decode
+    :param array raw: The ``"h"`` array of six to decode the accelerometer X, Y, Z
+        and gyroscope X, Y, Z counts into
+    """
+    offset = frame * FIFO_FRAME_SIZE
+    for i in range(6):
+        value = buffer[offset + 2 * i] << 8 | buffer[offset + 2 * i + 1]
+        raw[i] = value - 0x10000 if value & 0x8000 else value
+
+
+class ClashDetector:
+    """
+    Finds sudden changes in the magnitude of the acceleration, such as the blade
+    hitting something or the hilt being shaken.
+
+    Each sample's squared magnitude is high-pass filtered by subtracting the mean
+    of the ``window`` samples before it, which removes gravity and slow movement. A
+    clash is a peak of the filtered magnitude reaching ``threshold``, reported on
+    the sample after its highest point, after which ``refractory`` samples are
+    ignored so one hit is not reported twice.
+
+    With the default ``window`` of 1 the filtered magnitude is the change from the
+    previous sample. A wider window smooths out noise, but a magnitude rising
+    steadily then filters to up to ``(window + 1) / 2`` times its change per
+    sample, so scale a per-sample ``threshold`` by that to keep the sensitivity.
+
+    :param int threshold: The filtered magnitude of a clash, in squared counts
+        shifted right by `MAGNITUDE_SHIFT`
+    :param int refractory: The samples to ignore after a clash
+    :param int window: The samples averaged by the high-pass filter, up to 16
+    """
+
+    def __init__(self, threshold, refractory, window=1):
+        self.threshold = max(threshold, 1)
+        self.refractory = refractory
+        self.magnitudes = array("l", [0] * window)
+        self.position = 0
+        self.filled = 0
+        self.total = 0
+        self.peak = 0  # highest filtered magnitude of the peak in progress
+        self.quiet = 0  # samples left in the refractory period
+
+    def reset(self):
+        """Forget the samples seen so far, after the detector was not fed for a
+        while"""
+        self.position = 0
+        self.filled = 0
+        self.total = 0
+        self.peak = 0
+        self.quiet = 0
+
+    def add(self, accel_x, accel_y, accel_z):
+        """Add one sample and return the intensity of the clash it completes, or 0.
+
+        The intensity is the height of the peak as a multiple of ``threshold``, so
+        always at least 1.
+
+        :param int accel_x: The raw accelerometer X count
+        :param int accel_y: The raw accelerometer Y count
+        :param int accel_z: The raw accelerometer Z count
+        """
+        accel_x >>= MAGNITUDE_SHIFT
+        accel_y >>= MAGNITUDE_SHIFT
+        accel_z >>= MAGNITUDE_SHIFT
+        magnitude = accel_x * accel_x + accel_y * accel_y + accel_z * accel_z
+
+        magnitudes = self.magnitudes
+        size = len(magnitudes)
+        if self.filled:
+            filtered = abs(magnitude - self.total // self.filled)
+        else:
+            filtered = 0
+        if self.filled == size:
+            self.total -= magnitudes[self.position]
+        else:
+            self.filled += 1
+        magnitudes[self.position] = magnitude
+        self.total += magnitude
+        self.position = (self.position + 1) % size
+
+        if self.quiet:
+            self.quiet -= 1
+            return 0
+        if filtered >= self.threshold and filtered > self.peak:
+            self.peak = filtered
+            return 0
+        if not self.peak:
+            return 0
+        intensity = self.peak / self.threshold
+        self.peak = 0
+        self.quiet = self.refractory
+        return intensity
+
+    def add_frames(self, buffer, frames):
+        """Add the samples of FIFO frames in order and return the intensity of the
+        strongest clash among them, or 0.
+
+        :param bytearray buffer: The frames read by ``MPU6500.read_fifo``
+        :param int frames: The number of frames in ``buffer``
+        """
+        strongest = 0
+        for frame in range(frames):
+            offset = frame * FIFO_FRAME_SIZE
+            accel_x = buffer[offset] << 8 | buffer[offset + 1]
+            accel_y = buffer[offset + 2] << 8 | buffer[offset + 3]
+            accel_z = buffer[offset + 4] << 8 | buffer[offset + 5]
+            intensity = self.add(
+                accel_x - 0x10000 if accel_x & 0x8000 else accel_x,
+                accel_y - 0x10000 if accel_y & 0x8000 else accel_y,
+                accel_z - 0x10000 if accel_z & 0x8000 else accel_z,
+            )
+            if intensity > strongest:
+                strongest = intensity
+        return strongest
@@ -47,11 +47,17 @@ Implementation Notes
 # * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
 """
 
-from time import sleep
-from adafruit_register.i2c_struct import UnaryStruct, ROUnaryStruct
+from time import sleep, monotonic
+from adafruit_register.i2c_struct import Struct, UnaryStruct, ROUnaryStruct
 from adafruit_register.i2c_struct_array import StructArray
 from adafruit_register.i2c_bit import RWBit
 from adafruit_register.i2c_bits import RWBits
+from adafruit_register.i2c_staged import StagedWrites
+from adafruit_register.i2c_cached import (
+    CachedRWBits,
+    CachedUnaryStruct,
+    invalidate_cache,
+)
 import adafruit_bus_device.i2c_device as i2c_device
 
 try:
@@ -71,21 +77,40 @@ _MPU6500_SELF_TEST_X = 0x0D  # Self test factory calibrated values register
 _MPU6500_SELF_TEST_Y = 0x0E  # Self test factory calibrated values register
 _MPU6500_SELF_TEST_Z = 0x0F  # Self test factory calibrated values register
 _MPU6500_SELF_TEST_A = 0x10  # Self test factory calibrated values register
+_MPU6500_XG_OFFSET = 0x13  # Gyro X, Y, Z offset registers
 _MPU6500_SMPLRT_DIV = 0x19  # sample rate divisor register
 _MPU6500_CONFIG = 0x1A  # General configuration register
 _MPU6500_GYRO_CONFIG = 0x1B  # Gyro specfic configuration register
 _MPU6500_ACCEL_CONFIG = 0x1C  # Accelerometer specific configration register
+_MPU6500_ACCEL_CONFIG_2 = 0x1D  # Accelerometer filter configuration register
+_MPU6500_LP_ACCEL_ODR = 0x1E  # Low power accelerometer sample rate register
+_MPU6500_WOM_THR = 0x1F  # Wake-on-motion threshold register
+_MPU6500_FIFO_EN = 0x23  # Selects which sensor outputs are written to the FIFO
 _MPU6500_INT_PIN_CONFIG = 0x37  # Interrupt pin configuration register
+_MPU6500_INT_ENABLE = 0x38  # Interrupt enable register
+_MPU6500_INT_STATUS = 0x3A  # Interrupt status register, cleared on read
 _MPU6500_ACCEL_OUT = 0x3B  # base address for sensor data reads
 _MPU6500_TEMP_OUT = 0x41  # Temperature data high byte register
 _MPU6500_GYRO_OUT = 0x43  # base address for sensor data reads
 _MPU6500_SIG_PATH_RESET = 0x68  # register to reset sensor signal paths
+_MPU6500_ACCEL_INTEL_CTRL = 0x69  # Wake-on-motion logic control register
 _MPU6500_USER_CTRL = 0x6A  # FIFO and I2C Master control register
 _MPU6500_PWR_MGMT_1 = 0x6B  # Primary power/sleep control register
 _MPU6500_PWR_MGMT_2 = 0x6C  # Secondary power/sleep control register
+_MPU6500_FIFO_COUNT = 0x72  # FIFO byte count high byte register
+_MPU6500_FIFO_R_W = 0x74  # FIFO data read/write register
 _MPU6500_WHO_AM_I = 0x75  # Device ID register
+_MPU6500_XA_OFFSET = 0x77  # Accelerometer X offset register
+_MPU6500_YA_OFFSET = 0x7A  # Accelerometer Y offset register
+_MPU6500_ZA_OFFSET = 0x7D  # Accelerometer Z offset register
+
+_MPU6500_FIFO_SIZE = 512  # FIFO capacity in bytes
+_MPU6500_FIFO_ACCEL_GYRO = 0b01111000  # gyro X, Y, Z and accelerometer into the FIFO
+_MPU6500_LP_ACCEL_RATES = (2, 4, 6, 7)  # LP_ACCEL_ODR value for each `Rate`
+_MPU6500_WOM_THRESHOLD_LSB = 0.004 * 9.80665  # m/s^2 per WOM_THR count
 
 STANDARD_GRAVITY = 9.80665
+FIFO_FRAME_SIZE = 12  # bytes per accelerometer + gyroscope sample in the FIFO
 # pylint: enable=bad-whitespace
 
 
@@ -143,6 +168,9 @@ class Rate:  # pylint: disable=too-few-public-methods
     - ``Rate.CYCLE_5_HZ``
     - ``Rate.CYCLE_20_HZ``
     - ``Rate.CYCLE_40_HZ``
+
+    The MPU6500 runs these at the nearest low power accelerometer rates of
+    0.98, 3.91, 15.63 and 31.25 Hz.
     """
 
     CYCLE_1_25_HZ = 0  # 1.25 Hz
@@ -155,59 +183,111 @@ class MPU6500:
     """Driver for the MPU6050 6-DoF accelerometer and gyroscope.
     :param ~busio.I2C i2c_bus: The I2C bus the MPU6050 is connected to.
     :param address: The I2C slave address of the sensor
+    :param float timeout: How long to wait for the sensor to come out of reset, in seconds
+
+    The time bring-up took, in seconds, is kept in ``startup_time``.
     """
 
-    def __init__(self, i2c_bus, address=_MPU6500_DEFAULT_ADDRESS):
+    def __init__(self, i2c_bus, address=_MPU6500_DEFAULT_ADDRESS, timeout=0.1):
+        start = monotonic()
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
+        # state to restore when leaving wake-on-motion
+        self._resume_data_ready = False
+        self._resume_accel_filter = 0
+        self._raw_buffer = bytearray(14)
 
         # if self._device_id != _MPU6500_DEVICE_ID:
         #     print(self._device_id)
         #     raise RuntimeError("Failed to find MPU6500 - check your wiring!")
 
-        self.reset()
+        self.reset(timeout)
+
+        self.configure(
+            sample_rate_divisor=0,
+            filter_bandwidth=Bandwidth.BAND_260_HZ,
+            gyro_range=GyroRange.RANGE_500_DPS,
+            accelerometer_range=Range.RANGE_2_G,
+        )
+        with StagedWrites(self):
+            self._clock_source = 1  # set to use gyro x-axis as reference
+            self.sleep = False
+
+        self.startup_time = monotonic() - start
 
-        self._sample_rate_divisor = 0
-        self._filter_bandwidth = Bandwidth.BAND_260_HZ
-        self._gyro_range = GyroRange.RANGE_500_DPS
-        self._accel_range = Range.RANGE_2_G
-        sleep(0.100)
-        self._clock_source = 1  # set to use gyro x-axis as reference
-        sleep(0.100)
-        self.sleep = False
-        sleep(0.010)
+    def reset(self, timeout=0.1):
+        """Reinitialize the sensor
 
-    def reset(self):
-        """Reinitialize the sensor"""
+        :param float timeout: How long to wait for the sensor to come out of reset,
+            in seconds
+        """
         self._reset = True
-        while self._reset is True:
+        deadline = monotonic() + timeout
+        while not self._ready():
+            if monotonic() > deadline:
+                raise RuntimeError("MPU6500 did not come out of reset")
             sleep(0.001)
-        sleep(0.100)
+        # every register is back at its power-on value
+        invalidate_cache(self)
 
-        _signal_path_reset = 0b111  # reset all sensors
-        sleep(0.100)
+        self._signal_path_reset = 0b111  # reset all sensors
 
-    _clock_source = RWBits(3, _MPU6500_PWR_MGMT_1, 0)
+    def _ready(self):
+        # the sensor may not acknowledge its address while it resets
+        try:
+            return not self._reset and self._device_id not in (0x00, 0xFF)
+        except OSError:
+            return False
+
+    _clock_source = CachedRWBits(3, _MPU6500_PWR_MGMT_1, 0)
     _device_id = ROUnaryStruct(_MPU6500_WHO_AM_I, ">B")
 
     _reset = RWBit(_MPU6500_PWR_MGMT_1, 7, 1)
-    _signal_path_reset = RWBits(3, _MPU6500_SIG_PATH_RESET, 3)
+    _signal_path_reset = RWBits(3, _MPU6500_SIG_PATH_RESET, 0)
 
-    _gyro_range = RWBits(2, _MPU6500_GYRO_CONFIG, 3)
-    _accel_range = RWBits(2, _MPU6500_ACCEL_CONFIG, 3)
+    _gyro_range = CachedRWBits(2, _MPU6500_GYRO_CONFIG, 3)
+    _accel_range = CachedRWBits(2, _MPU6500_ACCEL_CONFIG, 3)
 
-    _filter_bandwidth = RWBits(2, _MPU6500_CONFIG, 3)
+    _filter_bandwidth = CachedRWBits(3, _MPU6500_CONFIG, 0)
 
-    _raw_accel_data = StructArray(_MPU6500_ACCEL_OUT, ">h", 3)
-    _raw_gyro_data = StructArray(_MPU6500_GYRO_OUT, ">h", 3)
+    _raw_accel_data = StructArray(_MPU6500_ACCEL_OUT, ">h", 3, keep_buffer=True)
+    _raw_gyro_data = StructArray(_MPU6500_GYRO_OUT, ">h", 3, keep_buffer=True)
     _raw_temp_data = ROUnaryStruct(_MPU6500_TEMP_OUT, ">h")
+    # SMPLRT_DIV, CONFIG, GYRO_CONFIG and ACCEL_CONFIG
+    _sensor_config = Struct(_MPU6500_SMPLRT_DIV, ">4B")
+    # accelerometer X, Y, Z, temperature, gyroscope X, Y, Z
+    _raw_motion_data = Struct(_MPU6500_ACCEL_OUT, ">7h")
+    _motion_register = bytes((_MPU6500_ACCEL_OUT,))
+
+    _gyro_offset = Struct(_MPU6500_XG_OFFSET, ">3h")
+    _accel_offset_x = UnaryStruct(_MPU6500_XA_OFFSET, ">h")
+    _accel_offset_y = UnaryStruct(_MPU6500_YA_OFFSET, ">h")
+    _accel_offset_z = UnaryStruct(_MPU6500_ZA_OFFSET, ">h")
 
     _cycle = RWBit(_MPU6500_PWR_MGMT_1, 5)
-    _cycle_rate = RWBits(2, _MPU6500_PWR_MGMT_2, 6, 1)
+    _cycle_rate = RWBits(4, _MPU6500_LP_ACCEL_ODR, 0)
+    _gyro_standby = RWBits(3, _MPU6500_PWR_MGMT_2, 0)
+    _accel_filter = UnaryStruct(_MPU6500_ACCEL_CONFIG_2, ">B")
+
+    _wake_on_motion = RWBits(2, _MPU6500_ACCEL_INTEL_CTRL, 6)
+    _wake_on_motion_threshold = UnaryStruct(_MPU6500_WOM_THR, ">B")
+    _wake_on_motion_interrupt = RWBit(_MPU6500_INT_ENABLE, 6)
+
+    _fifo_enable = RWBit(_MPU6500_USER_CTRL, 6)
+    _fifo_reset = RWBit(_MPU6500_USER_CTRL, 2)
+    _fifo_sources = UnaryStruct(_MPU6500_FIFO_EN, ">B")
+    _fifo_count = ROUnaryStruct(_MPU6500_FIFO_COUNT, ">H")
+    _fifo_register = bytes((_MPU6500_FIFO_R_W,))
+
+    _interrupt_latch = RWBit(_MPU6500_INT_PIN_CONFIG, 5)
+    _interrupt_read_clear = RWBit(_MPU6500_INT_PIN_CONFIG, 4)
+    _data_ready_interrupt = RWBit(_MPU6500_INT_ENABLE, 0)
+    _fifo_overflow_interrupt = RWBit(_MPU6500_INT_ENABLE, 4)
+    _interrupt_status = ROUnaryStruct(_MPU6500_INT_STATUS, ">B")
 
     sleep = RWBit(_MPU6500_PWR_MGMT_1, 6, 1)
     """Shuts down the accelerometers and gyroscopes, saving power. No new data will
     be recorded until the sensor is taken out of sleep by setting to `False`"""
-    sample_rate_divisor = UnaryStruct(_MPU6500_SMPLRT_DIV, ">B")
+    sample_rate_divisor = CachedUnaryStruct(_MPU6500_SMPLRT_DIV, ">B")
     """The sample rate divisor. See the datasheet for additional detail"""
 
     @property
@@ -220,13 +300,7 @@ class MPU6500:
         return temp
 
     @property
-    def acceleration(self):
-        """Acceleration X, Y, and Z axis data in m/s^2"""
-        raw_data = self._raw_accel_data
-        raw_x = raw_data[0][0]
-        raw_y = raw_data[1][0]
-        raw_z = raw_data[2][0]
-
+    def _accel_scale(self):
         accel_range = self._accel_range
         accel_scale = 1
         if accel_range == Range.RANGE_16_G:
@@ -237,6 +311,31 @@ class MPU6500:
             accel_scale = 8192
         if accel_range == Range.RANGE_2_G:
             accel_scale = 16384
+        return accel_scale
+
+    @property
+    def _gyro_scale(self):
+        gyro_scale = 1
+        gyro_range = self._gyro_range
+        if gyro_range == GyroRange.RANGE_250_DPS:
+            gyro_scale = 131
+        if gyro_range == GyroRange.RANGE_500_DPS:
+            gyro_scale = 62.5
+        if gyro_range == GyroRange.RANGE_1000_DPS:
+            gyro_scale = 32.8
+        if gyro_range == GyroRange.RANGE_2000_DPS:
+            gyro_scale = 16.4
+        return gyro_scale
+
+    @property
+    def acceleration(self):
+        """Acceleration X, Y, and Z axis data in m/s^2"""
+        raw_data = self._raw_accel_data.read_all()
+        raw_x = raw_data[0][0]
+        raw_y = raw_data[1][0]
+        raw_z = raw_data[2][0]
+
+        accel_scale = self._accel_scale
 
         # setup range dependant scaling
         accel_x = (raw_x / accel_scale) * STANDARD_GRAVITY
@@ -248,21 +347,12 @@ class MPU6500:
     @property
     def gyro(self):
         """Gyroscope X, Y, and Z axis data in º/s"""
-        raw_data = self._raw_gyro_data
+        raw_data = self._raw_gyro_data.read_all()
         raw_x = raw_data[0][0]
         raw_y = raw_data[1][0]
         raw_z = raw_data[2][0]
 
-        gyro_scale = 1
-        gyro_range = self._gyro_range
-        if gyro_range == GyroRange.RANGE_250_DPS:
-            gyro_scale = 131
-        if gyro_range == GyroRange.RANGE_500_DPS:
-            gyro_scale = 62.5
-        if gyro_range == GyroRange.RANGE_1000_DPS:
-            gyro_scale = 32.8
-        if gyro_range == GyroRange.RANGE_2000_DPS:
-            gyro_scale = 16.4
+        gyro_scale = self._gyro_scale
 
         # setup range dependant scaling
         gyro_x = raw_x / gyro_scale
@@ -271,6 +361,143 @@ class MPU6500:
 
         return (gyro_x, gyro_y, gyro_z)
 
+    @property
+    def raw_acceleration_scale(self):
+        """Raw accelerometer counts per m/s^2 at the current `accelerometer_range`"""
+        return self._accel_scale / STANDARD_GRAVITY
+
+    @property
+    def raw_gyro_scale(self):
+        """Raw gyroscope counts per º/s at the current `gyro_range`"""
+        return self._gyro_scale
+
+    def read_raw_into(self, buffer):
+        """Read the raw accelerometer X, Y, Z and gyroscope X, Y, Z counts of one
+        sample into ``buffer`` in a single transaction, without allocating memory.
+        Divide by `raw_acceleration_scale` and `raw_gyro_scale` for m/s^2 and º/s.
+
+        :param array buffer: An ``array("h")`` of at least 6 elements
+        """
+        raw = self._raw_buffer
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._motion_register, raw)
+        for axis in range(6):
+            # skip the temperature between the accelerometer and the gyroscope
+            index = 2 * axis + 2 if axis > 2 else 2 * axis
+            value = (raw[index] << 8) | raw[index + 1]
+            if value & 0x8000:
+                value -= 0x10000
+            buffer[axis] = value
+
+    @property
+    def motion(self):
+        """Acceleration X, Y, and Z axis data in m/s^2 and gyroscope X, Y, and Z axis
+        data in º/s as an ``(acceleration, gyro)`` tuple. Both come from the same
+        sample and are read in a single transaction"""
+        return self.read_all()
+
+    def read_all(self, temperature=False):
+        """Read the accelerometer, temperature and gyroscope outputs in a single
+        transaction, so every axis comes from the same sample.
+
+        :param bool temperature: Also return the temperature in º C
+        :return: ``(acceleration, gyro)``, or ``(acceleration, gyro, temperature)``
+            when ``temperature`` is set
+        """
+        raw_data = self._raw_motion_data
+        accel_scale = self._accel_scale
+        gyro_scale = self._gyro_scale
+
+        acceleration = (
+            (raw_data[0] / accel_scale) * STANDARD_GRAVITY,
+            (raw_data[1] / accel_scale) * STANDARD_GRAVITY,
+            (raw_data[2] / accel_scale) * STANDARD_GRAVITY,
+        )
+        gyro = (
+            raw_data[4] / gyro_scale,
+            raw_data[5] / gyro_scale,
+            raw_data[6] / gyro_scale,
+        )
+
+        if temperature:
+            return (acceleration, gyro, (raw_data[3] / 333.87) + 21.0)
+        return (acceleration, gyro)
+
+    @property
+    def accel_offset(self):
+        """The X, Y and Z accelerometer offset register values. The sensor adds them to
+        every sample in steps of 1/2048 g, bit 0 is reserved and left unchanged. A
+        `reset` restores the factory values"""
+        return (self._accel_offset_x, self._accel_offset_y, self._accel_offset_z)
+
+    @accel_offset.setter
+    def accel_offset(self, value):
+        self._accel_offset_x = (value[0] & ~1) | (self._accel_offset_x & 1)
+        self._accel_offset_y = (value[1] & ~1) | (self._accel_offset_y & 1)
+        self._accel_offset_z = (value[2] & ~1) | (self._accel_offset_z & 1)
+
+    @property
+    def gyro_offset(self):
+        """The X, Y and Z gyroscope offset register values. The sensor adds them to
+        every sample in steps of 1/32.8 º/s. A `reset` clears them"""
+        return self._gyro_offset
+
+    @gyro_offset.setter
+    def gyro_offset(self, value):
+        self._gyro_offset = value
+
+    def calibrate(self, samples=100, tolerance=0.1):
+        """Measure the bias of every axis while the sensor is at rest and cancel it in
+        the offset registers, so the correction costs nothing per sample.
+
+        The accelerometer is only calibrated when the sensor lies flat on one axis:
+        that axis reads 1 g and the others 0 g, give or take ``tolerance``. Lying at
+        an angle, gravity would be taken for bias on every axis, so only the
+        gyroscope is calibrated and `accel_offset` is left as it was.
+
+        :param int samples: The number of samples to average
+        :param float tolerance: How far in g the accelerometer axes may read from 1 g
+            and 0 g and still count as lying flat
+        :return: The new `accel_offset`, or `None` if the accelerometer was not
+            calibrated, and `gyro_offset` as a tuple
+        """
+        sums = [0] * 7
+        for _ in range(samples):
+            raw_data = self._raw_motion_data
+            for axis in range(7):
+                sums[axis] += raw_data[axis]
+            sleep(0.005)
+
+        accel_bias = [sums[axis] / samples for axis in range(3)]
+        gyro_bias = [sums[axis] / samples for axis in range(4, 7)]
+
+        # keep 1 g on the axis gravity is pulling along
+        accel_scale = self._accel_scale
+        gravity_axis = 0
+        for axis in range(1, 3):
+            if abs(accel_bias[axis]) > abs(accel_bias[gravity_axis]):
+                gravity_axis = axis
+        if accel_bias[gravity_axis] < 0:
+            accel_bias[gravity_axis] += accel_scale
+        else:
+            accel_bias[gravity_axis] -= accel_scale
+
+        # offsets are in +/- 16 g and +/- 1000 º/s full scale counts
+        new_accel_offset = None
+        if max(abs(bias) for bias in accel_bias) <= tolerance * accel_scale:
+            accel_offset = self.accel_offset
+            self.accel_offset = [
+                accel_offset[axis] - round(accel_bias[axis] * 2048 / accel_scale)
+                for axis in range(3)
+            ]
+            new_accel_offset = self.accel_offset
+        gyro_offset = self.gyro_offset
+        gyro_scale = (1 << self._gyro_range) / 4
+        self.gyro_offset = [
+            gyro_offset[axis] - round(gyro_bias[axis] * gyro_scale) for axis in range(3)
+        ]
+        return (new_accel_offset, self.gyro_offset)
+
     @property
     def cycle(self):
         """Enable or disable perodic measurement at a rate set by `cycle_rate`.
@@ -279,8 +506,130 @@ class MPU6500:
 
     @cycle.setter
     def cycle(self, value):
-        self.sleep = not value
-        self._cycle = value
+        with StagedWrites(self):
+            self.sleep = not value
+            self._cycle = value
+
+    @property
+    def fifo(self):
+        """Enable or disable streaming of accelerometer and gyroscope samples into the
+        on-chip FIFO at the sample rate. Queued samples are drained with `read_fifo`.
+        Toggling the FIFO discards anything already queued"""
+        return self._fifo_enable
+
+    @fifo.setter
+    def fifo(self, value):
+        self._fifo_enable = False
+        self._fifo_sources = _MPU6500_FIFO_ACCEL_GYRO if value else 0
+        self._fifo_reset = True
+        self._fifo_enable = value
+
+    def read_fifo(self, buffer):
+        """Drain queued samples from the FIFO into ``buffer`` with one burst read.
+
+        Each frame is `FIFO_FRAME_SIZE` bytes holding the raw big-endian signed
+        accelerometer X, Y, Z followed by the gyroscope X, Y, Z counts, and can be
+        decoded with ``struct.unpack_from(">6h", buffer, frame * FIFO_FRAME_SIZE)``.
+        Only whole frames that fit in ``buffer`` are read, the rest stay queued for
+        the next call. The FIFO holds 42 frames, so at a 1 kHz sample rate it must
+        be drained at least every 40 ms.
+
+        :param bytearray buffer: The buffer to read the frames into
+        :return: The number of frames read into ``buffer``
+        """
+        count = self._fifo_count & 0x1FFF
+        if count >= _MPU6500_FIFO_SIZE:
+            # the oldest bytes were overwritten so frame boundaries are lost,
+            # throw the backlog away and start again on a clean frame
+            self.fifo = True
+            return 0
+
+        frames = min(count, len(buffer)) // FIFO_FRAME_SIZE
+        if frames:
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(
+                    self._fifo_register, buffer, in_end=frames * FIFO_FRAME_SIZE
+                )
+        return frames
+
+    @property
+    def data_ready(self):
+        """`True` if a new sample was taken since the interrupt status was last read.
+        Reading this clears the interrupt"""
+        return bool(self._interrupt_status & 0x01)
+
+    @property
+    def motion_detected(self):
+        """`True` if wake-on-motion was triggered since the interrupt status was last
+        read. Reading this clears the interrupt"""
+        return bool(self._interrupt_status & 0x40)
+
+    def enable_wake_on_motion(self, threshold=0.5, rate=Rate.CYCLE_5_HZ):
+        """Park the sensor in low power, accelerometer only `cycle` mode and drive the
+        INT pin high once the acceleration on any axis changes by more than
+        ``threshold`` between two samples. Call `disable_wake_on_motion` to go back
+        to full rate sampling.
+
+        :param float threshold: The change in acceleration in m/s^2 that wakes the sensor
+        :param int rate: The low power sample rate. Must be a `Rate`
+        """
+        count = int(threshold / _MPU6500_WOM_THRESHOLD_LSB)
+        self._resume_data_ready = self._data_ready_interrupt
+        self._resume_accel_filter = self._accel_filter
+
+        with StagedWrites(self):
+            self._cycle = False
+            self.sleep = False
+            self._gyro_standby = 0b111
+        self._accel_filter = 0b00001001  # bypass the accelerometer filter
+        with StagedWrites(self):
+            self._data_ready_interrupt = False
+            self._interrupt_latch = True
+            self._interrupt_read_clear = True
+            self._wake_on_motion_interrupt = True
+            self._wake_on_motion = 0b11  # compare each sample to the previous one
+        self._wake_on_motion_threshold = min(max(count, 1), 255)
+        self.cycle_rate = rate
+        self.cycle = True
+
+    def disable_wake_on_motion(self):
+        """Leave wake-on-motion and resume full rate sampling of every sensor"""
+        with StagedWrites(self):
+            self._cycle = False
+            self._wake_on_motion = 0
+            self._wake_on_motion_interrupt = False
+            self._gyro_standby = 0
+        self._accel_filter = self._resume_accel_filter
+        sleep(0.035)  # gyroscope start-up time
+        self._data_ready_interrupt = self._resume_data_ready
+
+    @property
+    def data_ready_interrupt(self):
+        """Drive the INT pin high whenever a new sample is ready. The pin is latched and
+        stays high until the next register read, so polling it cannot miss a sample.
+        Samples are produced at 1 kHz / (1 + `sample_rate_divisor`) when
+        `filter_bandwidth` is not ``Bandwidth.BAND_260_HZ``, and at 8 kHz otherwise"""
+        return self._data_ready_interrupt
+
+    @data_ready_interrupt.setter
+    def data_ready_interrupt(self, value):
+        with StagedWrites(self):
+            self._interrupt_latch = True
+            self._interrupt_read_clear = True
+            self._data_ready_interrupt = value
+
+    @property
+    def fifo_overflow_interrupt(self):
+        """Drive the INT pin high when the FIFO fills up and starts losing samples.
+        The MPU6500 has no FIFO watermark interrupt, this is the closest substitute"""
+        return self._fifo_overflow_interrupt
+
+    @fifo_overflow_interrupt.setter
+    def fifo_overflow_interrupt(self, value):
+        with StagedWrites(self):
+            self._interrupt_latch = True
+            self._interrupt_read_clear = True
+            self._fifo_overflow_interrupt = value
 
     @property
     def gyro_range(self):
@@ -318,14 +667,60 @@ class MPU6500:
         self._filter_bandwidth = value
         sleep(0.01)
 
+    def configure(
+        self,
+        sample_rate_divisor=None,
+        filter_bandwidth=None,
+        gyro_range=None,
+        accelerometer_range=None,
+    ):
+        """Set the sample rate and measurement settings with a single read and a single
+        write of the configuration registers. Settings left as `None` are unchanged, and
+        nothing is written when every setting already has its value.
+
+        :param int sample_rate_divisor: The sample rate divisor, see `sample_rate_divisor`
+        :param int filter_bandwidth: The filter bandwidth. Must be a `Bandwidth`
+        :param int gyro_range: The gyroscope range. Must be a `GyroRange`
+        :param int accelerometer_range: The accelerometer range. Must be a `Range`
+        """
+        current = self._sensor_config
+        divisor, config, gyro_config, accel_config = current
+
+        if sample_rate_divisor is not None:
+            if (sample_rate_divisor < 0) or (sample_rate_divisor > 255):
+                raise ValueError("sample_rate_divisor must be between 0 and 255")
+            divisor = sample_rate_divisor
+        if filter_bandwidth is not None:
+            if (filter_bandwidth < 0) or (filter_bandwidth > 6):
+                raise ValueError("filter_bandwidth must be a Bandwidth")
+            config = (config & ~0x07) | filter_bandwidth
+        if gyro_range is not None:
+            if (gyro_range < 0) or (gyro_range > 3):
+                raise ValueError("gyro_range must be a GyroRange")
+            gyro_config = (gyro_config & ~0x18) | (gyro_range << 3)
+        if accelerometer_range is not None:
+            if (accelerometer_range < 0) or (accelerometer_range > 3):
+                raise ValueError("accelerometer_range must be a Range")
+            accel_config = (accel_config & ~0x18) | (accelerometer_range << 3)
+
+        if (divisor, config, gyro_config, accel_config) == current:
+            return
+        self._sensor_config = (divisor, config, gyro_config, accel_config)
+        invalidate_cache(self)
+        sleep(0.01)
+
     @property
     def cycle_rate(self):
         """The rate that measurements are taken while in `cycle` mode. Must be a `Rate`"""
-        return self._cycle_rate
+        lp_accel_rate = self._cycle_rate
+        for rate, value in enumerate(_MPU6500_LP_ACCEL_RATES):
+            if lp_accel_rate <= value:
+                return rate
+        return Rate.CYCLE_40_HZ
 
     @cycle_rate.setter
     def cycle_rate(self, value):
         if (value < 0) or (value > 3):
             raise ValueError("cycle_rate must be a Rate")
-        self._cycle_rate = value
+        self._cycle_rate = _MPU6500_LP_ACCEL_RATES[value]
         sleep(0.01)
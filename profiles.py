@@ -0,0 +1,356 @@
+"""
+Loaded sound profiles.
+
+A `Profile` holds the settings and sound file names of one profile folder, and a
+`ProfileCache` keeps the most recently used ones loaded so switching back to them
+does not list the folder or parse ``config.json`` again. Sounds are only opened
+when they are first played, through a `SoundPool` that caps how many files are
+open at once.
+
+When ``tools/build_manifest.py`` has written a `Manifest`, profiles are loaded from
+it without sorting the sounds of a folder or parsing ``config.json``. Only the
+number of files in the folder and the size and checksum of ``config.json`` are
+checked,
+and a folder that no longer matches its entry falls back to scanning it.
+"""
+
+import gc
+import json
+from binascii import crc32
+from os import listdir, stat
+from random import randint
+
+import audiocore
+
+# file name prefixes of the numbered sounds and the Profile attribute each fills
+_NUMBERED_SOUNDS = (
+    ("swingl", "swingl"),
+    ("swingh", "swingh"),
+    ("clsh", "clsh"),
+    ("in", "blade_in"),
+    ("out", "blade_out"),
+)
+
+MANIFEST_FILE = "manifest.json"
+
+# the parts of a manifest entry a Profile loads from, the rest is not kept
+_ENTRY_KEYS = (
+    "config_size",
+    "config_crc",
+    "file_count",
+    "config",
+    "sounds",
+    "shimmer",
+)
+
+
+class SoundPool:
+    """
+    The open sound files, at most ``max_open`` of them.
+
+    Opening another file closes the least recently used one that is not playing. If
+    every open file is playing the cap is exceeded rather than cutting a sound off.
+
+    :param int max_open: The most files to keep open
+    :param playing: Function called with a ``WaveFile`` that returns `True` while it
+        is playing. Defaults to treating no file as playing
+    :param int buffer_size: The bytes each ``WaveFile`` reads ahead, from 8 to 1024.
+        Defaults to the ``WaveFile`` default
+    """
+
+    def __init__(self, max_open=8, playing=None, buffer_size=None):
+        self.max_open = max_open
+        self.playing = playing
+        self.buffer_size = buffer_size
+        self.entries = []  # (path, file, sound, buffer), least recently used first
+        self.buffers = []  # read-ahead buffers of closed files, to reuse
+
+    def get(self, path):
+        """Return the ``WaveFile`` of ``path``, opening it if it is not open.
+
+        :param str path: The path of the WAV file
+        """
+        for entry in self.entries:
+            if entry[0] == path:
+                self.entries.remove(entry)
+                self.entries.append(entry)
+                return entry[2]
+
+        self._close_unused(self.max_open - 1)
+        file = open(path, "rb")
+        buffer = None
+        if self.buffer_size is not None:
+            if self.buffers:
+                buffer = self.buffers.pop()
+            else:
+                buffer = bytearray(self.buffer_size)
+            sound = audiocore.WaveFile(file, buffer)
+        else:
+            sound = audiocore.WaveFile(file)
+        self.entries.append((path, file, sound, buffer))
+        return sound
+
+    def close(self, directory=""):
+        """Close every open file in ``directory`` that is not playing.
+
+        :param str directory: The folder, with a trailing slash. Defaults to every
+            folder
+        """
+        for entry in list(self.entries):
+            if entry[0].startswith(directory) and not self._playing(entry[2]):
+                self._close(entry)
+
+    def _close_unused(self, keep):
+        for entry in list(self.entries):
+            if len(self.entries) <= keep:
+                return
+            if not self._playing(entry[2]):
+                self._close(entry)
+
+    def _playing(self, sound):
+        return self.playing is not None and self.playing(sound)
+
+    def _close(self, entry):
+        self.entries.remove(entry)
+        entry[2].deinit()
+        entry[1].close()
+        if entry[3] is not None:
+            self.buffers.append(entry[3])
+
+
+class Manifest:
+    """
+    The index of every profile folder written by ``tools/build_manifest.py``.
+
+    :param str profiles_path: The folder holding the profile folders, with a
+        trailing slash
+    :param dict data: The parsed manifest
+    """
+
+    def __init__(self, profiles_path, data):
+        self.names = [entry["name"] for entry in data["profiles"]]
+        self.ignored = data.get("ignored", [])
+        self.entries = {}
+        for entry in data["profiles"]:
+            self.entries[profiles_path + entry["name"] + "/"] = {
+                key: entry[key] for key in _ENTRY_KEYS if key in entry
+            }
+
+    def matches(self, profiles_path):
+        """`True` if the manifest lists every folder in ``profiles_path`` and nothing
+        else, not counting dot-files"""
+        names = [
+            name
+            for name in listdir(profiles_path)
+            if name != MANIFEST_FILE and not name.startswith(".")
+        ]
+        return sorted(names) == sorted(self.names + self.ignored)
+
+
+def load_manifest(profiles_path):
+    """Return the `Manifest` of ``profiles_path``, or `None` if there is none or it
+    is out of date.
+
+    :param str profiles_path: The folder holding the profile folders, with a
+        trailing slash
+    """
+    try:
+        with open(profiles_path + MANIFEST_FILE, "r") as file:
+            manifest = Manifest(profiles_path, json.load(file))
+    except (OSError, ValueError, KeyError):
+        return None
+    if not manifest.matches(profiles_path):
+        print("profile manifest is out of date, scanning profile folders")
+        return None
+    return manifest
+
+
+class Profile:
+    """
+    The settings and sound file names of one profile folder. Sounds are opened from
+    ``pool`` when they are first played.
+
+    :param str directory: The profile folder, with a trailing slash
+    :param SoundPool pool: The pool to open sounds from
+    :param dict entry: The manifest entry of the folder. Defaults to scanning it
+    """
+
+    hum = "hum01.wav"
+    select = "select.wav"
+
+    def __init__(self, directory, pool, entry=None):
+        self.directory = directory
+        self.pool = pool
+        self.from_manifest = False
+        self.shimmer_table = None
+        self.shimmer_loop_ms = 0
+        self.derived = None  # what code.py computes from config, kept with it
+
+        if entry is not None:
+            self.from_manifest = self._load_entry(entry)
+            if not self.from_manifest:
+                print(f"profile manifest is out of date for {directory}, scanning it")
+        if not self.from_manifest:
+            self._scan()
+
+        if len(self.swingl) != len(self.swingh):
+            print("swingh and swingl must come in pairs")
+
+    def _load_entry(self, entry):
+        # the manifest only holds while config.json is as it was when it was built
+        # and no file was added to or removed from the folder
+        try:
+            files = [
+                name for name in listdir(self.directory) if not name.startswith(".")
+            ]
+            if len(files) != entry["file_count"]:
+                return False
+            if stat(self.directory + "config.json")[6] != entry["config_size"]:
+                return False
+            # the checksum is kept to 30 bits so it stays a small int on the board
+            with open(self.directory + "config.json", "rb") as file:
+                if crc32(file.read()) & 0x3FFFFFFF != entry["config_crc"]:
+                    return False
+            self.config = entry["config"]
+            sounds = entry["sounds"]
+            for _, attribute in _NUMBERED_SOUNDS:
+                setattr(self, attribute, sounds[attribute])
+        except (OSError, KeyError):
+            return False
+        if entry.get("shimmer"):
+            self._load_shimmer()
+        return True
+
+    def _scan(self):
+        with open(self.directory + "config.json", "r") as file:
+            self.config = json.load(file)
+
+        numbered = {}
+        for prefix, _ in _NUMBERED_SOUNDS:
+            numbered[prefix] = {}
+        for filename in listdir(self.directory):
+            if not filename.endswith(".wav"):
+                continue
+            for prefix, _ in _NUMBERED_SOUNDS:
+                if filename.startswith(prefix):
+                    number = int(filename[len(prefix) : len(prefix) + 2]) - 1
+                    numbered[prefix][number] = filename
+                    break
+        for prefix, attribute in _NUMBERED_SOUNDS:
+            names = numbered[prefix]
+            numbers = sorted(names)
+            if numbers and numbers[-1] != len(numbers) - 1:
+                print(f"{prefix} files in {self.directory} are not numbered 01 up")
+            setattr(self, attribute, [names[number] for number in numbers])
+        self._load_shimmer()
+
+    def _load_shimmer(self):
+        # shimmer.bin holds the hum loop length in milliseconds followed by its
+        # loudness per LED frame, built by tools/build_shimmer.py
+        try:
+            with open(self.directory + "shimmer.bin", "rb") as file:
+                data = file.read()
+        except OSError:
+            print(f"no shimmer table in {self.directory}, the blade will not shimmer")
+            return
+        self.shimmer_loop_ms = data[0] | data[1] << 8
+        self.shimmer_table = data[2:]
+
+    def sound(self, filename):
+        """Return the ``WaveFile`` of a sound of the profile, opening it if needed.
+
+        :param str filename: The file name of the sound
+        """
+        return self.pool.get(self.directory + filename)
+
+    def pick(self, attribute, number=None):
+        """Return the ``WaveFile`` of a numbered sound, opening it if needed. If a
+        sound listed by the manifest is missing the folder is scanned instead.
+
+        :param str attribute: The sound list, ``"swingl"``, ``"swingh"``, ``"clsh"``,
+            ``"blade_in"`` or ``"blade_out"``
+        :param int number: The index in the list. Defaults to a random one
+        """
+        names = getattr(self, attribute)
+        if number is None or number >= len(names):
+            number = randint(0, len(names) - 1)
+        try:
+            return self.sound(names[number])
+        except OSError:
+            if not self.from_manifest:
+                raise
+        print(f"profile manifest is out of date for {self.directory}, scanning it")
+        self.from_manifest = False
+        self._scan()
+        return self.pick(attribute, number)
+
+    def swing_pair(self, number=None):
+        """Return the matching ``swingl`` and ``swingh`` sounds, opening them if
+        needed.
+
+        :param int number: The index of the pair. Defaults to a random one
+        """
+        if number is None:
+            number = randint(0, len(self.swingl) - 1)
+        return (self.pick("swingl", number), self.pick("swingh", number))
+
+    def close(self):
+        """Close the open sound files of the profile that are not playing"""
+        self.pool.close(self.directory)
+
+
+class ProfileCache:
+    """
+    The most recently used profiles, kept loaded.
+
+    Holds up to ``size`` profiles, and fewer when loading another would leave less
+    than ``min_free`` bytes of memory free. The least recently used profile is closed
+    first, and the one most recently returned by `get` is never closed.
+
+    :param int size: The most profiles to keep loaded
+    :param int min_free: The memory in bytes to keep free, checked with
+        ``gc.mem_free()``
+    :param Manifest manifest: The manifest to load profiles from. Defaults to
+        scanning their folders
+    :param SoundPool pool: The pool profiles open their sounds from. Defaults to a
+        new `SoundPool`
+    """
+
+    def __init__(self, size=2, min_free=40 * 1024, manifest=None, pool=None):
+        self.size = max(size, 1)
+        self.min_free = min_free
+        self.manifest = manifest
+        self.pool = pool if pool is not None else SoundPool()
+        self.profiles = []  # least recently used first
+
+    def get(self, directory):
+        """Return the loaded profile of ``directory``, loading it if it is not cached.
+
+        :param str directory: The profile folder, with a trailing slash
+        """
+        for profile in self.profiles:
+            if profile.directory == directory:
+                self.profiles.remove(profile)
+                self.profiles.append(profile)
+                return profile
+
+        self._evict(self.size - 1, 0)
+        entry = None
+        if self.manifest is not None:
+            entry = self.manifest.entries.get(directory)
+        profile = Profile(directory, self.pool, entry)
+        self.profiles.append(profile)
+        self._evict(self.size, 1)
+        return profile
+
+    def _evict(self, keep, spare):
+        # close the least recently used profiles until at most keep are loaded and
+        # enough memory is free, leaving the spare most recently used ones alone
+        gc.collect()
+        while len(self.profiles) > spare and (
+            len(self.profiles) > keep or gc.mem_free() < self.min_free
+        ):
+            profile = self.profiles.pop(0)
+            print(f"closing profile {profile.directory}")
+            profile.close()
+            gc.collect()
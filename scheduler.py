@@ -0,0 +1,83 @@
+"""
+Fixed rate timers for the asyncio tasks in ``code.py``.
+
+Each `Periodic` keeps to absolute deadlines, so the time spent on work between
+ticks does not make its rate drift, and records how late it ran. Time comes from
+``supervisor.ticks_ms()``, which unlike ``time.monotonic()`` does not lose
+precision the longer the board runs, and wraps around every 2 ** 29 ms.
+"""
+
+import asyncio
+from supervisor import ticks_ms
+
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALFPERIOD = _TICKS_PERIOD // 2
+
+
+def ticks_add(ticks, delta):
+    """Add ``delta`` milliseconds to a ``ticks_ms()`` value"""
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(end, start):
+    """Milliseconds from ``start`` to ``end``, both ``ticks_ms()`` values"""
+    return ((end - start + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
+
+class Periodic:
+    """
+    Fixed rate timer against absolute deadlines.
+
+    Each tick is due one period after the previous deadline, not after the previous
+    tick ran. A tick that runs late still counts towards ``max_jitter_ms``, and when
+    whole periods are missed they are counted in ``overruns`` and skipped instead
+    of being run back to back.
+
+    :param int period_ms: The period between ticks in milliseconds
+    """
+
+    def __init__(self, period_ms):
+        self.period_ms = period_ms
+        self.deadline = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.max_jitter_ms = 0
+        self.reset()
+
+    def reset(self):
+        """Start counting periods from now, after the loop was blocked on purpose"""
+        self.deadline = ticks_add(ticks_ms(), self.period_ms)
+
+    def remaining(self, now=None):
+        """Milliseconds until the next tick is due, negative once it is late"""
+        if now is None:
+            now = ticks_ms()
+        return ticks_diff(self.deadline, now)
+
+    def due(self, now=None):
+        """`True` once, when a tick is due, moving on to the next deadline"""
+        if now is None:
+            now = ticks_ms()
+        late = ticks_diff(now, self.deadline)
+        if late < 0:
+            return False
+
+        self.ticks += 1
+        if late > self.max_jitter_ms:
+            self.max_jitter_ms = late
+        missed = late // self.period_ms
+        self.overruns += missed
+        self.deadline = ticks_add(self.deadline, (missed + 1) * self.period_ms)
+        return True
+
+    async def wait(self):
+        """Yield to other tasks until the next tick is due and move on to the
+        following deadline"""
+        while not self.due():
+            await asyncio.sleep(max(self.remaining(), 0) / 1000)
+
+    def __str__(self):
+        return "{} ms: {} ticks, {} overruns, {} ms worst jitter".format(
+            self.period_ms, self.ticks, self.overruns, self.max_jitter_ms
+        )
@@ -0,0 +1,60 @@
+"""
+Profile storage on an SD card.
+
+`mount_sd` mounts a card on an SPI bus so profiles can be loaded from it instead
+of the internal flash, and `read_rate` measures how fast sounds can be streamed
+from it, reading several files in turn the way the mixer voices do.
+"""
+
+from scheduler import ticks_diff
+from supervisor import ticks_ms
+
+
+def mount_sd(spi, cs, mount_point="/sd", baudrate=24_000_000):
+    """Mount the SD card at ``mount_point`` and return `True`, or return `False` if
+    there is no card or the board cannot drive one.
+
+    :param busio.SPI spi: The SPI bus the card is on
+    :param microcontroller.Pin cs: The chip select pin of the card
+    :param str mount_point: The folder to mount the card at
+    :param int baudrate: The SPI clock in Hz
+    """
+    try:
+        import sdcardio
+        import storage
+    except ImportError:
+        return False
+
+    try:
+        card = sdcardio.SDCard(spi, cs, baudrate=baudrate)
+        storage.mount(storage.VfsFat(card), mount_point)
+    except OSError:
+        return False
+    return True
+
+
+def read_rate(paths, buffer, duration_ms=250):
+    """Return the bytes per second read from ``paths`` by reading ``buffer`` sized
+    chunks from each in turn for ``duration_ms``, starting a file over when it ends.
+
+    :param paths: The files to read
+    :param bytearray buffer: The buffer to read into, as big as a read-ahead buffer
+    :param int duration_ms: How long to read for in milliseconds
+    """
+    files = [open(path, "rb") for path in paths]
+    read = 0
+    try:
+        start = ticks_ms()
+        elapsed = 0
+        while elapsed < duration_ms:
+            for file in files:
+                count = file.readinto(buffer)
+                if not count:
+                    file.seek(0)
+                    count = 0
+                read += count
+            elapsed = ticks_diff(ticks_ms(), start)
+    finally:
+        for file in files:
+            file.close()
+    return read * 1000 // max(elapsed, 1)
@@ -0,0 +1,158 @@
+"""
+Microbenchmarks for the `mpu6500` driver on the `fake_i2c` bus.
+
+Reports the I2C transactions, bytes on the bus, lock acquisitions and peak Python
+memory allocated per call of each driver operation. Allocation numbers come from
+CPython's ``tracemalloc`` so they only track CircuitPython in relative terms.
+
+Run from the repository root::
+
+    python tools/bench_mpu6500.py
+    python tools/bench_mpu6500.py --check  # fail if a transaction budget is exceeded
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable=wrong-import-position
+from fake_i2c import install, RecordingI2C
+
+install()
+
+from mpu6500 import MPU6500, FIFO_FRAME_SIZE
+
+# most transactions each operation may take before --check fails
+BUDGETS = {
+    "init": 12,
+    "acceleration": 1,
+    "gyro": 1,
+    "motion": 1,
+    "read_raw_into": 1,
+    "read_fifo (10 frames)": 2,
+}
+
+
+def peak_allocation(operation, repeat):
+    """Return the most memory ``operation`` allocated on top of what was already in
+    use, over ``repeat`` calls"""
+    peak_allocated = 0
+    tracemalloc.start()
+    for _ in range(repeat):
+        in_use, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_allocated = max(peak_allocated, peak - in_use)
+    tracemalloc.stop()
+    return peak_allocated
+
+
+def measure(i2c, operation, repeat):
+    """Run ``operation`` ``repeat`` times and return the per call bus counts, peak
+    allocated bytes and host time"""
+    operation()  # warm up lazily created buffers and caches
+    i2c.reset_counts()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    elapsed = time.perf_counter() - start
+    result = {
+        "transactions": i2c.transactions / repeat,
+        "bytes": (i2c.bytes_out + i2c.bytes_in) / repeat,
+        "locks": i2c.locks / repeat,
+        "host us": elapsed / repeat * 1e6,
+    }
+
+    i2c.recording = False
+    result["peak alloc"] = peak_allocation(operation, repeat)
+    i2c.recording = True
+    return result
+
+
+def measure_init():
+    """Bring up a sensor from power on and return its bus counts, peak allocated
+    bytes and host time"""
+    i2c = RecordingI2C()
+    start = time.perf_counter()
+    mpu = MPU6500(i2c, address=0x68)
+    elapsed = time.perf_counter() - start
+    result = {
+        "transactions": i2c.transactions,
+        "bytes": i2c.bytes_out + i2c.bytes_in,
+        "locks": i2c.locks,
+        "host us": elapsed * 1e6,
+    }
+
+    # bring up a second sensor on its own bus, so it starts from power on too
+    other = RecordingI2C()
+    other.recording = False
+    result["peak alloc"] = peak_allocation(lambda: MPU6500(other, address=0x68), 1)
+    return mpu, i2c, result
+
+
+def run(repeat):
+    """Run every benchmark and return the results by operation name"""
+    mpu, i2c, results = measure_init()
+    results = {"init": results}
+    device = i2c.device
+    device.set_motion(accel=(120, -340, 16384), gyro=(25, -1200, 40), temperature=80)
+
+    raw = array("h", [0] * 6)
+    results["acceleration"] = measure(i2c, lambda: mpu.acceleration, repeat)
+    results["gyro"] = measure(i2c, lambda: mpu.gyro, repeat)
+    results["motion"] = measure(i2c, lambda: mpu.motion, repeat)
+    results["read_raw_into"] = measure(i2c, lambda: mpu.read_raw_into(raw), repeat)
+
+    mpu.fifo = True
+    frames = bytearray(10 * FIFO_FRAME_SIZE)
+
+    def drain():
+        for _ in range(10):
+            device.push_fifo(accel=(0, 0, 16384), gyro=(1, 2, 3))
+        mpu.read_fifo(frames)
+
+    results["read_fifo (10 frames)"] = measure(i2c, drain, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="calls per benchmark")
+    parser.add_argument(
+        "--check", action="store_true", help="exit non-zero if a budget is exceeded"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    columns = ("transactions", "bytes", "locks", "peak alloc", "host us")
+    print("{:<24}".format("operation") + "".join("{:>14}".format(c) for c in columns))
+    for name, result in results.items():
+        print(
+            "{:<24}".format(name)
+            + "".join("{:>14.1f}".format(result[column]) for column in columns)
+        )
+
+    over_budget = [
+        name
+        for name, result in results.items()
+        if result["transactions"] > BUDGETS.get(name, float("inf"))
+    ]
+    for name in over_budget:
+        print(
+            "{} takes {:.1f} transactions, budget is {}".format(
+                name, results[name]["transactions"], BUDGETS[name]
+            )
+        )
+    if args.check and over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Build the profile manifest the board loads profiles from.
+
+Writes ``profiles/manifest.json``, one index of every profile folder: its name and
+number of files, the values, size and checksum of ``config.json``, the sounds of
+each category in playing order and the format and length of every WAV file. With it ``code.py`` skips listing the profile folders at boot and on every
+profile switch. A manifest the board finds out of date is ignored in favour of
+scanning, so rerun this after changing any profile.
+
+Problems the board would only notice at runtime are reported here: gaps in the
+numbering of a category, ``swingl`` and ``swingh`` files without a partner, missing
+required files and sounds in a format the mixer does not play.
+
+Run from the repository root::
+
+    python tools/build_manifest.py
+    python tools/build_manifest.py --strict  # fail if anything is reported
+"""
+
+import argparse
+import binascii
+import json
+import os
+import sys
+import wave
+
+MANIFEST_FILE = "manifest.json"
+
+# the format the mixer in code.py plays: sample rate, channels and bits per sample
+MIXER_FORMAT = (16000, 1, 16)
+
+# file name prefixes of the numbered sounds and the Profile attribute each fills,
+# as in profiles.py
+NUMBERED_SOUNDS = (
+    ("swingl", "swingl"),
+    ("swingh", "swingh"),
+    ("clsh", "clsh"),
+    ("in", "blade_in"),
+    ("out", "blade_out"),
+)
+
+
+def wav_format(path):
+    """Return the sample rate, channels, bits per sample and length in milliseconds
+    of a WAV file"""
+    with wave.open(path, "rb") as file:
+        rate = file.getframerate()
+        return [
+            rate,
+            file.getnchannels(),
+            file.getsampwidth() * 8,
+            round(file.getnframes() * 1000 / rate),
+        ]
+
+
+def number_of(filename, prefix):
+    """Return the number in a ``<prefix>NN.wav`` file name, or `None`"""
+    digits = filename[len(prefix) : len(prefix) + 2]
+    if filename != prefix + digits + ".wav" or not digits.isdigit():
+        return None
+    return int(digits)
+
+
+def index_profile(directory, name, problems):
+    """Return the manifest entry of one profile folder, adding anything wrong with it
+    to ``problems``"""
+    # skip dot-files such as the ._hum01.wav stubs macOS writes to drives, which
+    # are not sounds and which the board does not count either
+    filenames = sorted(
+        filename for filename in os.listdir(directory) if not filename.startswith(".")
+    )
+    for required in ("config.json", "hum01.wav", "select.wav"):
+        if required not in filenames:
+            problems.append("{}: {} is missing".format(name, required))
+
+    config_path = os.path.join(directory, "config.json")
+    config = {}
+    config_data = b""
+    if os.path.isfile(config_path):
+        with open(config_path, "rb") as file:
+            config_data = file.read()
+        config = json.loads(config_data)
+
+    sounds = {"hum": "hum01.wav", "select": "select.wav"}
+    numbers = {}
+    for prefix, attribute in NUMBERED_SOUNDS:
+        numbered = {}
+        for filename in filenames:
+            if filename.startswith(prefix) and filename.endswith(".wav"):
+                number = number_of(filename, prefix)
+                if number is None:
+                    problems.append(
+                        "{}: {} is not named {}NN.wav".format(name, filename, prefix)
+                    )
+                else:
+                    numbered[number] = filename
+        expected = list(range(1, len(numbered) + 1))
+        if sorted(numbered) != expected:
+            problems.append(
+                "{}: {} files are numbered {} instead of 01 up".format(
+                    name, prefix, ", ".join("{:02}".format(n) for n in sorted(numbered))
+                )
+            )
+        sounds[attribute] = [numbered[number] for number in sorted(numbered)]
+        numbers[prefix] = set(numbered)
+
+    for unpaired in sorted(numbers["swingl"] ^ numbers["swingh"]):
+        problems.append(
+            "{}: swing {:02} has no swingl/swingh partner".format(name, unpaired)
+        )
+
+    formats = {}
+    for filename in filenames:
+        if filename.endswith(".wav"):
+            formats[filename] = wav_format(os.path.join(directory, filename))
+            if tuple(formats[filename][:3]) != MIXER_FORMAT:
+                problems.append(
+                    "{}: {} is {} Hz, {} channel(s), {} bit, the mixer plays {} Hz, "
+                    "{} channel(s), {} bit".format(
+                        name, filename, *formats[filename][:3], *MIXER_FORMAT
+                    )
+                )
+
+    return {
+        "name": name,
+        "config_size": len(config_data),
+        # kept to 30 bits, as profiles.py compares it
+        "config_crc": binascii.crc32(config_data) & 0x3FFFFFFF,
+        "file_count": len(filenames),
+        "config": config,
+        "sounds": sounds,
+        "formats": formats,
+        "shimmer": "shimmer.bin" in filenames,
+    }
+
+
+def build(profiles_path):
+    """Return the manifest of every folder in ``profiles_path`` and the problems
+    found in them"""
+    problems = []
+    profiles = []
+    ignored = []
+    for name in sorted(os.listdir(profiles_path)):
+        directory = os.path.join(profiles_path, name)
+        # the board does not count dot-files either, computers add them to drives
+        if name == MANIFEST_FILE or name.startswith("."):
+            continue
+        if not os.path.isdir(directory) or not os.listdir(directory):
+            ignored.append(name)
+            continue
+        profiles.append(index_profile(directory, name, problems))
+    return {"profiles": profiles, "ignored": ignored}, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--profiles", default="profiles", help="the folder holding the profiles"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="exit non-zero if a problem is found"
+    )
+    args = parser.parse_args()
+
+    manifest, problems = build(args.profiles)
+    path = os.path.join(args.profiles, MANIFEST_FILE)
+    with open(path, "w") as file:
+        json.dump(manifest, file, separators=(",", ":"))
+    print(
+        "{}: {} profiles, {} bytes".format(
+            path, len(manifest["profiles"]), os.path.getsize(path)
+        )
+    )
+
+    for problem in problems:
+        print(problem)
+    if args.strict and problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
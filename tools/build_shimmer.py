@@ -0,0 +1,102 @@
+"""
+Build the blade shimmer table of every profile from its hum.
+
+Reads ``hum01.wav`` from each profile folder and writes ``shimmer.bin`` next to it:
+the loop length in milliseconds as a little-endian ``uint16``, followed by one byte
+per frame holding the loudness of the hum during that frame, scaled so the quietest
+frame is 0 and the loudest is 255. ``code.py`` maps those bytes onto a palette of
+blade colors, so the blade shimmers in step with the hum without any math on the
+board.
+
+Run from the repository root after adding or changing a hum::
+
+    python tools/build_shimmer.py
+    python tools/build_shimmer.py profiles/obiwan --frame-ms 20
+"""
+
+import argparse
+import array
+import os
+import struct
+import sys
+import wave
+
+HUM_FILE = "hum01.wav"
+SHIMMER_FILE = "shimmer.bin"
+
+
+def read_mono(path):
+    """Return the sample rate and the samples of the first channel of a 8 or 16 bit
+    PCM wave file"""
+    with wave.open(path, "rb") as file:
+        rate = file.getframerate()
+        channels = file.getnchannels()
+        width = file.getsampwidth()
+        frames = file.readframes(file.getnframes())
+
+    if width == 2:
+        samples = array.array("h", frames)
+        if sys.byteorder == "big":
+            samples.byteswap()
+    elif width == 1:
+        samples = array.array("h", (value - 128 for value in frames))
+    else:
+        raise ValueError("{} is not 8 or 16 bit PCM".format(path))
+    return rate, samples[::channels]
+
+
+def envelope(samples, window):
+    """Return the RMS level of each ``window`` samples long stretch of ``samples``"""
+    levels = []
+    for start in range(0, len(samples) - window + 1, window):
+        chunk = samples[start : start + window]
+        levels.append((sum(value * value for value in chunk) / window) ** 0.5)
+    return levels
+
+
+def build(profile_directory, frame_ms):
+    """Write the shimmer table of one profile and return its number of frames"""
+    rate, samples = read_mono(os.path.join(profile_directory, HUM_FILE))
+    levels = envelope(samples, max(rate * frame_ms // 1000, 1))
+    if not levels:
+        raise ValueError("{} is shorter than one frame".format(profile_directory))
+
+    low = min(levels)
+    spread = max(levels) - low or 1
+    table = bytes(round((level - low) * 255 / spread) for level in levels)
+    loop_ms = round(len(samples) * 1000 / rate)
+    with open(os.path.join(profile_directory, SHIMMER_FILE), "wb") as file:
+        file.write(struct.pack("<H", min(loop_ms, 0xFFFF)))
+        file.write(table)
+    return len(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "profiles",
+        nargs="*",
+        help="profile folders, defaults to every folder in profiles/",
+    )
+    parser.add_argument(
+        "--frame-ms",
+        type=int,
+        default=20,
+        help="milliseconds per table entry, the LED frame period",
+    )
+    args = parser.parse_args()
+
+    profiles = args.profiles
+    if not profiles:
+        profiles = sorted(
+            os.path.join("profiles", name)
+            for name in os.listdir("profiles")
+            if os.path.isfile(os.path.join("profiles", name, HUM_FILE))
+        )
+    for profile_directory in profiles:
+        frames = build(profile_directory, args.frame_ms)
+        print("{}: {} frames".format(profile_directory, frames))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Host-side stand-ins for running `mpu6500` and `adafruit_register` on a regular
+Python install.
+
+`RecordingI2C` takes the place of ``busio.I2C`` and serves an in-memory `FakeMPU6500`
+register map while recording every transaction, and `install` registers the
+CircuitPython-only modules the driver imports (``micropython``,
+``adafruit_bus_device`` and ``circuitpython_typing``) when they are missing.
+
+.. code-block:: python
+
+    from fake_i2c import install, RecordingI2C
+    install()
+
+    from mpu6500 import MPU6500
+    i2c = RecordingI2C()
+    mpu = MPU6500(i2c, address=0x68)
+    i2c.device.set_motion(accel=(0, 0, 16384), gyro=(0, 0, 0))
+    i2c.reset_counts()
+    mpu.gyro
+    print(i2c.transactions, i2c.bytes_out, i2c.bytes_in, i2c.locks)
+"""
+
+import struct
+import sys
+import types
+
+_PWR_MGMT_1 = 0x6B
+_SIG_PATH_RESET = 0x68
+_USER_CTRL = 0x6A
+_INT_STATUS = 0x3A
+_ACCEL_OUT = 0x3B
+_FIFO_COUNT = 0x72
+_FIFO_R_W = 0x74
+_WHO_AM_I = 0x75
+
+_FIFO_SIZE = 512
+
+
+class FakeMPU6500:
+    """
+    In-memory MPU6500 register map.
+
+    Registers auto-increment on burst access, ``PWR_MGMT_1`` H_RESET restores the
+    power-on values and clears itself, ``INT_STATUS`` clears on read, and the FIFO
+    is served through ``FIFO_COUNT`` and ``FIFO_R_W``.
+
+    :param int device_id: The ``WHO_AM_I`` value
+    """
+
+    def __init__(self, device_id=0x71):
+        self.device_id = device_id
+        self.registers = bytearray(128)
+        self.fifo = bytearray()
+        self.pointer = 0  # the register a read without an address starts at
+        self.power_on()
+
+    def power_on(self):
+        """Restore the power-on register values and empty the FIFO"""
+        self.registers[:] = bytes(len(self.registers))
+        self.registers[_PWR_MGMT_1] = 0x40  # asleep
+        self.registers[_WHO_AM_I] = self.device_id
+        self.fifo = bytearray()
+
+    def set_motion(self, accel=(0, 0, 0), gyro=(0, 0, 0), temperature=0):
+        """Latch a new sample of raw counts into the output registers and flag it as
+        ready in ``INT_STATUS``"""
+        struct.pack_into(">7h", self.registers, _ACCEL_OUT, *accel, temperature, *gyro)
+        self.registers[_INT_STATUS] |= 0x01
+
+    def push_fifo(self, accel=(0, 0, 0), gyro=(0, 0, 0)):
+        """Queue one accelerometer + gyroscope frame of raw counts in the FIFO"""
+        self.fifo += struct.pack(">6h", *accel, *gyro)
+        if len(self.fifo) > _FIFO_SIZE:
+            del self.fifo[: len(self.fifo) - _FIFO_SIZE]
+        self.registers[_INT_STATUS] |= 0x01
+
+    def write(self, data):
+        """Handle a write transaction: register address followed by values"""
+        register = data[0]
+        self.pointer = register
+        for value in data[1:]:
+            self._write_register(register, value)
+            if register != _FIFO_R_W:
+                register += 1
+
+    def read(self, register=None, length=1):
+        """Handle a read transaction starting at ``register``, or where the last
+        transaction left the register pointer"""
+        if register is None:
+            register = self.pointer
+        if register == _FIFO_R_W:
+            data = bytes(self.fifo[:length]).ljust(length, b"\x00")
+            del self.fifo[:length]
+            return data
+        self.pointer = register + length
+        data = bytearray(length)
+        for i in range(length):
+            data[i] = self._read_register(register + i)
+        return bytes(data)
+
+    def _write_register(self, register, value):
+        if register == _PWR_MGMT_1 and value & 0x80:
+            self.power_on()
+            return
+        if register == _SIG_PATH_RESET:
+            return  # self clearing
+        if register == _USER_CTRL and value & 0x04:
+            self.fifo = bytearray()
+            value &= ~0x04  # self clearing
+        if register == _FIFO_R_W:
+            self.fifo.append(value)
+            return
+        self.registers[register] = value
+
+    def _read_register(self, register):
+        if register == _FIFO_COUNT:
+            return len(self.fifo) >> 8
+        if register == _FIFO_COUNT + 1:
+            return len(self.fifo) & 0xFF
+        value = self.registers[register]
+        if register == _INT_STATUS:
+            self.registers[register] = 0
+        return value
+
+
+class Transaction:
+    """One recorded bus transaction.
+
+    :param str kind: ``"write"``, ``"read"`` or ``"write_read"``
+    :param int address: The device address
+    :param bytes data_out: The bytes written
+    :param bytes data_in: The bytes read
+    """
+
+    def __init__(self, kind, address, data_out=b"", data_in=b""):
+        self.kind = kind
+        self.address = address
+        self.data_out = data_out
+        self.data_in = data_in
+
+    def __repr__(self):
+        return "Transaction({}, 0x{:02x}, out={}, in={})".format(
+            self.kind, self.address, self.data_out.hex(), self.data_in.hex()
+        )
+
+
+class RecordingI2C:
+    """
+    Stand-in for ``busio.I2C`` that serves `FakeMPU6500` register maps and records
+    every transaction and lock acquisition.
+
+    :param dict devices: Device objects by address. Defaults to a `FakeMPU6500` at
+        both MPU6500 addresses, sharing one register map
+
+    Set ``recording`` to `False` to stop recording, for example while measuring
+    memory allocations of the code under test.
+    """
+
+    def __init__(self, devices=None):
+        if devices is None:
+            device = FakeMPU6500()
+            devices = {0x68: device, 0x69: device}
+        self.devices = devices
+        self.recording = True
+        self.log = []
+        self.locks = 0
+        self._locked = False
+
+    @property
+    def device(self):
+        """The first device on the bus"""
+        return next(iter(self.devices.values()))
+
+    @property
+    def transactions(self):
+        """The number of transactions since the last `reset_counts`"""
+        return len(self.log)
+
+    @property
+    def bytes_out(self):
+        """The number of bytes written since the last `reset_counts`"""
+        return sum(len(transaction.data_out) for transaction in self.log)
+
+    @property
+    def bytes_in(self):
+        """The number of bytes read since the last `reset_counts`"""
+        return sum(len(transaction.data_in) for transaction in self.log)
+
+    def reset_counts(self):
+        """Forget the recorded transactions and lock acquisitions"""
+        self.log = []
+        self.locks = 0
+
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        if self.recording:
+            self.locks += 1
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def _record(self, transaction):
+        if self.recording:
+            self.log.append(transaction)
+
+    def _device(self, address):
+        if not self._locked:
+            raise RuntimeError("Function requires lock")
+        if address not in self.devices:
+            raise OSError(19, "No such device")
+        return self.devices[address]
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        device = self._device(address)
+        data = bytes(buffer[start:end])
+        self._record(Transaction("write", address, data_out=data))
+        if data:
+            device.write(data)
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        data_in = device.read(length=end - start)
+        buffer[start:end] = data_in
+        self._record(Transaction("read", address, data_in=data_in))
+
+    def writeto_then_readfrom(  # pylint: disable=too-many-arguments
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        device = self._device(address)
+        data_out = bytes(buffer_out[out_start:out_end])
+        if in_end is None:
+            in_end = len(buffer_in)
+        data_in = device.read(data_out[0], in_end - in_start)
+        buffer_in[in_start:in_end] = data_in
+        self._record(Transaction("write_read", address, data_out, data_in))
+
+
+class I2CDevice:
+    """Host copy of ``adafruit_bus_device.i2c_device.I2CDevice``"""
+
+    def __init__(self, i2c, device_address, probe=True):
+        self.i2c = i2c
+        self.device_address = device_address
+        if probe:
+            with self:
+                self.i2c.writeto(device_address, b"")
+
+    def readinto(self, buf, *, start=0, end=None):
+        self.i2c.readfrom_into(self.device_address, buf, start=start, end=end)
+
+    def write(self, buf, *, start=0, end=None):
+        self.i2c.writeto(self.device_address, buf, start=start, end=end)
+
+    def write_then_readinto(  # pylint: disable=too-many-arguments
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        self.i2c.writeto_then_readfrom(
+            self.device_address,
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+
+    def __enter__(self):
+        while not self.i2c.try_lock():
+            pass
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.i2c.unlock()
+        return False
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Register host stand-ins for the CircuitPython modules the driver imports,
+    leaving any real installed copies alone"""
+    try:
+        import micropython  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        _module("micropython", const=lambda value: value)
+
+    try:
+        # pylint: disable=import-outside-toplevel,unused-import
+        import adafruit_bus_device.i2c_device
+    except ImportError:
+        package = _module("adafruit_bus_device", __path__=[])
+        package.i2c_device = _module(
+            "adafruit_bus_device.i2c_device", I2CDevice=I2CDevice
+        )
+
+    try:
+        # pylint: disable=import-outside-toplevel,unused-import
+        import circuitpython_typing.device_drivers
+    except ImportError:
+        package = _module("circuitpython_typing", __path__=[])
+        package.device_drivers = _module(
+            "circuitpython_typing.device_drivers", I2CDeviceDriver=object
+        )
+    try:
+        import typing_extensions  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        import typing  # pylint: disable=import-outside-toplevel
+
+        _module("typing_extensions", Literal=typing.Literal)
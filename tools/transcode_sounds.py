@@ -0,0 +1,262 @@
+"""
+Convert every profile sound to the format the mixer plays.
+
+The ``audiomixer.Mixer`` in ``code.py`` plays 16 kHz mono 16 bit signed samples and
+does not convert anything it is given. This rewrites each WAV file in the profile
+folders and ``other_sounds`` in that format: other sample rates are resampled,
+channels are mixed down to mono, other bit depths are converted, and silence at the
+start and end is trimmed, except from the hum and swing loops, which must keep their
+length to loop seamlessly and stay in step with each other. Files are converted in
+parallel across a process pool, and the flash each profile saves is reported.
+
+``--bits 8`` writes unsigned 8 bit files instead, half the size of 16 bit ones. The
+mixer only plays one format, so then every sound has to be converted and the
+``bits_per_sample`` and ``samples_signed`` of the mixer in ``code.py`` changed to 8
+and ``False``.
+
+Run from the repository root, then rerun ``build_shimmer.py`` and
+``build_manifest.py``::
+
+    python tools/transcode_sounds.py --dry-run  # only report the savings
+    python tools/transcode_sounds.py
+    python tools/transcode_sounds.py profiles/obiwan --output converted
+"""
+
+import argparse
+import array
+import os
+import sys
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+# the format the mixer in code.py plays: sample rate, channels and bits per sample
+MIXER_FORMAT = (16000, 1, 16)
+
+SOUND_FOLDERS = ("profiles", "other_sounds")
+
+# loops that code.py plays together and restarts in step, so their length is kept
+UNTRIMMED_PREFIXES = ("hum", "swing")
+
+
+def read_samples(path):
+    """Return the sample rate and the 16 bit mono samples of a 8, 16, 24 or 32 bit
+    PCM wave file, mixing the channels down"""
+    with wave.open(path, "rb") as file:
+        rate = file.getframerate()
+        channels = file.getnchannels()
+        width = file.getsampwidth()
+        frames = file.readframes(file.getnframes())
+
+    if width == 1:
+        values = [(value - 128) << 8 for value in frames]
+    elif width == 2:
+        values = array.array("h", frames)
+        if sys.byteorder == "big":
+            values.byteswap()
+    elif width in (3, 4):
+        # keep the top two bytes of each little-endian sample
+        values = array.array(
+            "h",
+            b"".join(
+                frames[i + width - 2 : i + width] for i in range(0, len(frames), width)
+            ),
+        )
+        if sys.byteorder == "big":
+            values.byteswap()
+    else:
+        raise ValueError("{} is not 8, 16, 24 or 32 bit PCM".format(path))
+
+    if channels == 1:
+        return rate, array.array("h", values)
+    mono = array.array("h", bytes(2 * (len(values) // channels)))
+    for i in range(len(mono)):
+        mono[i] = sum(values[i * channels : (i + 1) * channels]) // channels
+    return rate, mono
+
+
+def resample(samples, rate, target_rate):
+    """Return ``samples`` at ``rate`` resampled to ``target_rate`` by linear
+    interpolation, averaging first when the rate drops so it does not alias"""
+    if rate == target_rate or not samples:
+        return samples
+
+    if rate > target_rate:
+        width = -(-rate // target_rate)
+        total = 0
+        smoothed = array.array("h", samples)
+        for i in range(len(samples)):
+            total += samples[i]
+            if i >= width:
+                total -= samples[i - width]
+            smoothed[i] = total // min(i + 1, width)
+        samples = smoothed
+
+    count = len(samples) * target_rate // rate
+    resampled = array.array("h", bytes(2 * count))
+    last = len(samples) - 1
+    for i in range(count):
+        position = i * rate / target_rate
+        before = int(position)
+        after = min(before + 1, last)
+        fraction = position - before
+        resampled[i] = round(
+            samples[before] + (samples[after] - samples[before]) * fraction
+        )
+    return resampled
+
+
+def trim_silence(samples, threshold, pad):
+    """Return ``samples`` without the stretches at the start and end that stay
+    within ``threshold`` of zero, keeping ``pad`` samples either side of the sound"""
+    start = 0
+    while start < len(samples) and abs(samples[start]) <= threshold:
+        start += 1
+    if start == len(samples):
+        return samples[:0]
+    end = len(samples)
+    while abs(samples[end - 1]) <= threshold:
+        end -= 1
+    return samples[max(start - pad, 0) : min(end + pad, len(samples))]
+
+
+def encode(samples, bits):
+    """Return the frames of ``samples`` as 16 bit signed or 8 bit unsigned PCM"""
+    if bits == 8:
+        return bytes(min((value + 128 >> 8) + 128, 255) for value in samples)
+    samples = array.array("h", samples)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def transcode(path, output, bits, threshold, pad_ms, dry_run):
+    """Convert one sound and return its size before and after in bytes, and a
+    description of what changed"""
+    rate, channels, _ = MIXER_FORMAT
+    with wave.open(path, "rb") as file:
+        source = (file.getframerate(), file.getnchannels(), file.getsampwidth() * 8)
+
+    source_rate, samples = read_samples(path)
+    length = len(samples)
+    samples = resample(samples, source_rate, rate)
+    if not os.path.basename(path).startswith(UNTRIMMED_PREFIXES):
+        samples = trim_silence(samples, threshold, rate * pad_ms // 1000)
+    trimmed_ms = (length * rate // source_rate - len(samples)) * 1000 // rate
+    frames = encode(samples, bits)
+
+    changes = []
+    if source != (rate, channels, bits):
+        changes.append("{} Hz, {} channel(s), {} bit".format(*source))
+    if trimmed_ms:
+        changes.append("{} ms of silence".format(trimmed_ms))
+    if not changes and output == path:
+        return os.path.getsize(path), os.path.getsize(path), changes
+
+    if not dry_run:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with wave.open(output, "wb") as file:
+            file.setnchannels(channels)
+            file.setsampwidth(bits // 8)
+            file.setframerate(rate)
+            file.writeframes(frames)
+    # a canonical WAV header is 44 bytes
+    return os.path.getsize(path), 44 + len(frames), changes
+
+
+def find_sounds(folders):
+    """Return the WAV files under ``folders`` grouped by the folder holding them"""
+    groups = {}
+    for folder in folders:
+        for root, _, filenames in sorted(os.walk(folder)):
+            # skip dot-files such as the ._select.wav stubs macOS writes to drives
+            sounds = [
+                name
+                for name in sorted(filenames)
+                if name.endswith(".wav") and not name.startswith(".")
+            ]
+            if sounds:
+                groups[root] = [os.path.join(root, name) for name in sounds]
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "folders",
+        nargs="*",
+        help="folders of sounds, defaults to profiles/ and other_sounds/",
+    )
+    parser.add_argument(
+        "--output", help="write the converted tree here instead of in place"
+    )
+    parser.add_argument(
+        "--bits", type=int, choices=(8, 16), default=16, help="bits per sample"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        default=64,
+        help="16 bit sample level at or below which the ends count as silence",
+    )
+    parser.add_argument(
+        "--pad-ms",
+        type=int,
+        default=10,
+        help="milliseconds to keep either side of the trimmed sound",
+    )
+    parser.add_argument("--jobs", type=int, help="processes, defaults to every CPU")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report the savings without writing"
+    )
+    args = parser.parse_args()
+
+    groups = find_sounds(args.folders or SOUND_FOLDERS)
+    with ProcessPoolExecutor(args.jobs) as pool:
+        futures = {}
+        for folder, paths in groups.items():
+            for path in paths:
+                output = path
+                if args.output:
+                    output = os.path.join(args.output, os.path.relpath(path))
+                futures[path] = pool.submit(
+                    transcode,
+                    path,
+                    output,
+                    args.bits,
+                    args.threshold,
+                    args.pad_ms,
+                    args.dry_run,
+                )
+
+        total_before = total_after = 0
+        for folder, paths in groups.items():
+            before = after = 0
+            for path in paths:
+                size, new_size, changes = futures[path].result()
+                before += size
+                after += new_size
+                if changes:
+                    print("  {}: {}".format(path, ", ".join(changes)))
+            print(
+                "{}: {} KB -> {} KB, {} KB saved ({:.0%})".format(
+                    folder,
+                    before // 1024,
+                    after // 1024,
+                    (before - after) // 1024,
+                    (before - after) / before,
+                )
+            )
+            total_before += before
+            total_after += after
+
+    print(
+        "total: {} KB -> {} KB, {} KB saved".format(
+            total_before // 1024,
+            total_after // 1024,
+            (total_before - total_after) // 1024,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()